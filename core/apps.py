@@ -9,7 +9,7 @@ class CoreConfig(AppConfig):
         from django.contrib.auth.models import User
         from django.db.models.signals import post_save
         from .role_utils import ensure_user_profile
-        from .signals import connect_project_activity_signals
+        from .signals import connect_project_activity_signals, connect_project_cache_signals
 
         def create_user_profile(sender, instance, created, **kwargs):
             if created:
@@ -17,3 +17,4 @@ class CoreConfig(AppConfig):
 
         post_save.connect(create_user_profile, sender=User, dispatch_uid='core_create_user_profile')
         connect_project_activity_signals()
+        connect_project_cache_signals()
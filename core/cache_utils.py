@@ -0,0 +1,79 @@
+"""Project-scoped response caching for hot read-only endpoints."""
+
+import hashlib
+
+from django.core.cache import cache
+
+# Bump the version suffix when the serialized payload shape changes.
+PROJECT_WALLS_KEY = 'project:{project_id}:walls:v1'
+PROJECT_DOORS_KEY = 'project:{project_id}:doors:v1'
+
+# Entries are invalidated on writes, so the TTL is only a safety net.
+PROJECT_RESPONSE_TTL = 24 * 60 * 60
+
+# Analysis results are derived from the full wall/room graph; keep the TTL
+# short so even a missed invalidation can't serve stale numbers for long.
+PROJECT_ANALYSIS_TTL = 5 * 60
+
+
+def project_walls_cache_key(project_id):
+    return PROJECT_WALLS_KEY.format(project_id=project_id)
+
+
+def project_doors_cache_key(project_id):
+    return PROJECT_DOORS_KEY.format(project_id=project_id)
+
+
+def get_cached_project_response(key):
+    return cache.get(key)
+
+
+def set_cached_project_response(key, data):
+    cache.set(key, data, PROJECT_RESPONSE_TTL)
+
+
+def invalidate_project_walls(project_id):
+    if project_id is not None:
+        cache.delete(project_walls_cache_key(project_id))
+
+
+def invalidate_project_doors(project_id):
+    if project_id is not None:
+        cache.delete(project_doors_cache_key(project_id))
+
+
+def _analysis_version_key(project_id):
+    return f'project:{project_id}:analysis:ver'
+
+
+def project_analysis_cache_key(domain, project_id, params=None):
+    """Key for a cached analysis result, scoped to project + parameters.
+
+    The key embeds a per-project version counter: bumping the counter on a
+    wall/room mutation orphans every cached analysis for the project at once,
+    which the plain Django cache API cannot do with pattern deletes. Orphaned
+    entries simply age out via PROJECT_ANALYSIS_TTL.
+    """
+    param_hash = hashlib.md5(
+        repr(sorted((params or {}).items())).encode()
+    ).hexdigest()[:12]
+    version = cache.get(_analysis_version_key(project_id), 0)
+    return f'project:{project_id}:analysis:{domain}:ver{version}:{param_hash}'
+
+
+def get_cached_analysis(key):
+    return cache.get(key)
+
+
+def set_cached_analysis(key, data):
+    cache.set(key, data, PROJECT_ANALYSIS_TTL)
+
+
+def invalidate_project_analyses(project_id):
+    if project_id is None:
+        return
+    try:
+        cache.incr(_analysis_version_key(project_id))
+    except ValueError:
+        # Counter not present yet (or backend without incr-on-missing)
+        cache.set(_analysis_version_key(project_id), 1, None)
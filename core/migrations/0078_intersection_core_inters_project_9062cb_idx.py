@@ -0,0 +1,17 @@
+# Generated by Django 5.1.4 on 2026-08-27 15:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0077_projectsharelink'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='intersection',
+            index=models.Index(fields=['project', 'wall_1', 'wall_2'], name='core_inters_project_9062cb_idx'),
+        ),
+    ]
@@ -1070,6 +1070,12 @@ class Intersection(models.Model):
 
     class Meta:
         unique_together = ('wall_1', 'wall_2')
-        
+        indexes = [
+            # set_joint looks up intersections by project plus wall pair;
+            # the single-column FK indexes alone leave Postgres to intersect
+            # or re-filter, so cover the full lookup in one index.
+            models.Index(fields=['project', 'wall_1', 'wall_2']),
+        ]
+
     def __str__(self):
         return f"Intersection between Wall {self.wall_1.id} and Wall {self.wall_2.id} in Project {self.project.name}"
\ No newline at end of file
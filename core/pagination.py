@@ -0,0 +1,26 @@
+"""Opt-in cursor pagination for high-cardinality list endpoints."""
+
+from rest_framework.pagination import CursorPagination
+
+
+class OptionalCursorPagination(CursorPagination):
+    """Cursor pagination that only activates when the client asks for it.
+
+    The React frontend consumes plain arrays from the wall/panel list
+    endpoints, so pagination must stay opt-in: requests without a
+    ``cursor`` or ``page_size`` parameter keep returning the full list.
+    Clients fetching very large projects can pass ``?page_size=200`` to
+    stream fixed-size windows instead, which bounds per-request memory
+    and lets Postgres apply LIMIT against the primary-key index.
+    """
+
+    page_size = 200
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+    ordering = 'id'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if self.cursor_query_param not in params and self.page_size_query_param not in params:
+            return None
+        return super().paginate_queryset(queryset, request, view=view)
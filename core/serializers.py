@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from .constants import WALL_JOINING_METHODS
 from .models import (
     Project,
     ProjectFolder,
@@ -103,13 +104,32 @@ class WallSerializer(serializers.ModelSerializer):
         if value <= 0:
             raise serializers.ValidationError("Outer face thickness must be greater than 0")
         return value
-    
+
+    def validate(self, attrs):
+        """Normalize wall coordinates during validation.
+
+        Doing it here (instead of copying request.data in every view entry
+        point) covers create, create_wall and update with one code path and
+        avoids the per-request QueryDict copy."""
+        if all(key in attrs for key in ('start_x', 'start_y', 'end_x', 'end_y')):
+            from .services import normalize_wall_coordinates
+            attrs['start_x'], attrs['start_y'], attrs['end_x'], attrs['end_y'] = (
+                normalize_wall_coordinates(
+                    attrs['start_x'], attrs['start_y'], attrs['end_x'], attrs['end_y']
+                )
+            )
+        return attrs
+
     def update(self, instance, validated_data):
         """Override update to apply AA11 wall height adjustment"""
         from .services import CeilingService
-        
-        # Update the instance
-        instance = super().update(instance, validated_data)
+
+        # Write only the fields present in the payload so a partial PATCH
+        # issues an UPDATE over the changed columns instead of every column.
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        if validated_data:
+            instance.save(update_fields=list(validated_data.keys()))
         
         # Apply AA11 wall height adjustment if joint type is AA11
         if instance.ceiling_joint_type == 'AA11':
@@ -371,6 +391,21 @@ class IntersectionSerializer(serializers.ModelSerializer):
         model = Intersection
         fields = ['id', 'project', 'wall_1', 'wall_2', 'joining_method']
 
+    def validate(self, attrs):
+        """Validate the wall pair during DRF's validation phase.
+
+        Wall order is intentionally preserved (wall_1 gets shortened for
+        butt-in joints), so pairs are checked for sanity but never reordered.
+        """
+        wall_1 = attrs.get('wall_1') or getattr(self.instance, 'wall_1', None)
+        wall_2 = attrs.get('wall_2') or getattr(self.instance, 'wall_2', None)
+        if wall_1 and wall_2:
+            if wall_1.pk == wall_2.pk:
+                raise serializers.ValidationError('An intersection requires two different walls.')
+            if wall_1.project_id != wall_2.project_id:
+                raise serializers.ValidationError('Both walls must belong to the same project.')
+        return attrs
+
 
 class RoomSerializer(serializers.ModelSerializer):
     walls = serializers.PrimaryKeyRelatedField(many=True, queryset=Wall.objects.all(), required=False)
@@ -775,4 +810,38 @@ class ProjectListSerializer(serializers.ModelSerializer):
             'created_at',
             'updated_at',
             'unread_comment_count',
-        ]
\ No newline at end of file
+        ]
+
+# --- Action payload serializers -------------------------------------------
+# Input validation for the custom @action endpoints. These replace ad-hoc
+# `all([...])` guards (which wrongly treated 0/0.0 values as missing) and
+# give type coercion for free.
+
+class SplitWallInputSerializer(serializers.Serializer):
+    wall_id = serializers.IntegerField()
+    intersection_x = serializers.FloatField()
+    intersection_y = serializers.FloatField()
+
+
+class MergeWallsInputSerializer(serializers.Serializer):
+    wall_ids = serializers.ListField(
+        child=serializers.IntegerField(), min_length=2, max_length=2
+    )
+
+
+class ProjectAnalysisInputSerializer(serializers.Serializer):
+    """Typed fields for the plan-generation/analysis actions that previously
+    hand-rolled int()/float() conversions inside try/except blocks."""
+    project_id = serializers.IntegerField()
+    custom_panel_length = serializers.FloatField(required=False, allow_null=True)
+
+
+class SetJointInputSerializer(serializers.Serializer):
+    wall_1 = serializers.IntegerField()
+    wall_2 = serializers.IntegerField()
+    joining_method = serializers.ChoiceField(choices=WALL_JOINING_METHODS)
+
+    def validate(self, attrs):
+        if attrs['wall_1'] == attrs['wall_2']:
+            raise serializers.ValidationError('An intersection requires two different walls.')
+        return attrs
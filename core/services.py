@@ -385,15 +385,16 @@ class WallService:
         - Ceiling joint settings
         """
         with transaction.atomic():
-            wall = Wall.objects.get(pk=wall_id)
+            # Lock the row so concurrent splits of the same wall serialize
+            wall = Wall.objects.select_for_update().get(pk=wall_id)
             
             # Normalize first segment
             norm_start_x1, norm_start_y1, norm_end_x1, norm_end_y1 = normalize_wall_coordinates(
                 wall.start_x, wall.start_y, intersection_x, intersection_y
             )
             split_wall_1 = Wall.objects.create(
-                project=wall.project,
-                storey=wall.storey,
+                project_id=wall.project_id,
+                storey_id=wall.storey_id,
                 start_x=norm_start_x1,
                 start_y=norm_start_y1,
                 end_x=norm_end_x1,
@@ -428,8 +429,8 @@ class WallService:
                 intersection_x, intersection_y, wall.end_x, wall.end_y
             )
             split_wall_2 = Wall.objects.create(
-                project=wall.project,
-                storey=wall.storey,
+                project_id=wall.project_id,
+                storey_id=wall.storey_id,
                 start_x=norm_start_x2,
                 start_y=norm_start_y2,
                 end_x=norm_end_x2,
@@ -515,8 +516,8 @@ class WallService:
         
         # Create the merged wall (properties match by validation above)
         merged_wall = Wall.objects.create(
-            project=wall_1.project,
-            storey=wall_1.storey,
+            project_id=wall_1.project_id,
+            storey_id=wall_1.storey_id,
             start_x=norm_start_x,
             start_y=norm_start_y,
             end_x=norm_end_x,
@@ -766,6 +767,84 @@ class RoomService:
             raise ValueError('At least 3 points are required to define a room polygon.')
         return True
 
+    @staticmethod
+    def _compute_room_boundary(room):
+        """Compute refreshed boundary points for a room whose walls are already
+        loaded (works off the walls prefetch cache, no extra queries).
+        Returns the normalized point list, or None if the room has no walls.
+        IMPORTANT: This preserves the original polygon point order to maintain
+        proper clockwise/counterclockwise arrangement."""
+        walls = room.walls.all()
+
+        if not walls:
+            return None
+
+        # Get the original room_points to preserve order
+        original_points = RoomService.normalize_room_points(room.room_points if room.room_points else [])
+
+        # Collect all unique endpoints from walls
+        endpoints = set()
+        for wall in walls:
+            endpoints.add((wall.start_x, wall.start_y))
+            endpoints.add((wall.end_x, wall.end_y))
+
+        # Convert to list
+        current_endpoints = list(endpoints)
+
+        # If we have original points, try to match them to current endpoints
+        # This preserves the polygon order while updating coordinates
+        if original_points and len(original_points) == len(current_endpoints):
+            # Create a mapping from original points to current endpoints
+            # We'll find the closest matching endpoint for each original point
+            from math import sqrt
+
+            def distance(p1, p2):
+                return sqrt((p1[0] - p2[0])**2 + (p1[1] - p2[1])**2)
+
+            # For each original point, find the closest current endpoint
+            new_room_points = []
+            used_endpoints = set()
+
+            for orig_point in original_points:
+                orig_coords = (orig_point['x'], orig_point['y'])
+                closest_endpoint = None
+                min_distance = float('inf')
+
+                for endpoint in current_endpoints:
+                    if endpoint not in used_endpoints:
+                        dist = distance(orig_coords, endpoint)
+                        if dist < min_distance:
+                            min_distance = dist
+                            closest_endpoint = endpoint
+
+                if closest_endpoint:
+                    new_room_points.append({'x': closest_endpoint[0], 'y': closest_endpoint[1]})
+                    used_endpoints.add(closest_endpoint)
+                else:
+                    # Fallback: use original point if no match found
+                    new_room_points.append(orig_point)
+
+            room_points = new_room_points
+        else:
+            # Fallback: if no original points or count mismatch, align endpoints using manual order
+            if original_points:
+                room_points = RoomService._map_points_to_endpoints(original_points, current_endpoints)
+            elif current_endpoints:
+                # No original points to reference - best effort by angle sort
+                center_x = sum(p[0] for p in current_endpoints) / len(current_endpoints)
+                center_y = sum(p[1] for p in current_endpoints) / len(current_endpoints)
+
+                def angle_from_center(point):
+                    import math
+                    return math.atan2(point[1] - center_y, point[0] - center_x)
+
+                current_endpoints.sort(key=angle_from_center)
+                room_points = [{'x': x, 'y': y} for x, y in current_endpoints]
+            else:
+                room_points = []
+
+        return RoomService.normalize_room_points(room_points)
+
     @staticmethod
     def recalculate_room_boundary_from_walls(room_id):
         """Recalculate room boundary points from the current walls.
@@ -774,89 +853,23 @@ class RoomService:
         proper clockwise/counterclockwise arrangement."""
         from .models import Room
         import logging
-        
+
         logger = logging.getLogger(__name__)
         logger.info(f"Recalculating room boundary for room {room_id}")
-        
+
         try:
-            room = Room.objects.get(id=room_id)
-            walls = room.walls.all()
-            
-            if not walls.exists():
+            room = Room.objects.prefetch_related('walls').get(id=room_id)
+            room_points = RoomService._compute_room_boundary(room)
+            if room_points is None:
                 logger.warning(f"No walls found for room {room_id}")
                 return False
-            
-            # Get the original room_points to preserve order
-            original_points = RoomService.normalize_room_points(room.room_points if room.room_points else [])
-            
-            # Collect all unique endpoints from walls
-            endpoints = set()
-            for wall in walls:
-                endpoints.add((wall.start_x, wall.start_y))
-                endpoints.add((wall.end_x, wall.end_y))
-            
-            # Convert to list
-            current_endpoints = list(endpoints)
-            
-            # If we have original points, try to match them to current endpoints
-            # This preserves the polygon order while updating coordinates
-            if original_points and len(original_points) == len(current_endpoints):
-                # Create a mapping from original points to current endpoints
-                # We'll find the closest matching endpoint for each original point
-                from math import sqrt
-                
-                def distance(p1, p2):
-                    return sqrt((p1[0] - p2[0])**2 + (p1[1] - p2[1])**2)
-                
-                # For each original point, find the closest current endpoint
-                new_room_points = []
-                used_endpoints = set()
-                
-                for orig_point in original_points:
-                    orig_coords = (orig_point['x'], orig_point['y'])
-                    closest_endpoint = None
-                    min_distance = float('inf')
-                    
-                    for endpoint in current_endpoints:
-                        if endpoint not in used_endpoints:
-                            dist = distance(orig_coords, endpoint)
-                            if dist < min_distance:
-                                min_distance = dist
-                                closest_endpoint = endpoint
-                    
-                    if closest_endpoint:
-                        new_room_points.append({'x': closest_endpoint[0], 'y': closest_endpoint[1]})
-                        used_endpoints.add(closest_endpoint)
-                    else:
-                        # Fallback: use original point if no match found
-                        new_room_points.append(orig_point)
-                
-                room_points = new_room_points
-            else:
-                # Fallback: if no original points or count mismatch, align endpoints using manual order
-                if original_points:
-                    room_points = RoomService._map_points_to_endpoints(original_points, current_endpoints)
-                elif current_endpoints:
-                    # No original points to reference - best effort by angle sort
-                    center_x = sum(p[0] for p in current_endpoints) / len(current_endpoints)
-                    center_y = sum(p[1] for p in current_endpoints) / len(current_endpoints)
-
-                    def angle_from_center(point):
-                        import math
-                        return math.atan2(point[1] - center_y, point[0] - center_x)
-
-                    current_endpoints.sort(key=angle_from_center)
-                    room_points = [{'x': x, 'y': y} for x, y in current_endpoints]
-                else:
-                    room_points = []
-            
-            # Update the room's room_points
-            room.room_points = RoomService.normalize_room_points(room_points)
+
+            room.room_points = room_points
             room.save()
-            
+
             logger.info(f"Updated room {room_id} boundary with {len(room_points)} points (order preserved)")
             return True
-            
+
         except Room.DoesNotExist:
             logger.error(f"Room {room_id} not found")
             return False
@@ -864,6 +877,47 @@ class RoomService:
             logger.error(f"Error recalculating room boundary: {str(e)}")
             return False
 
+    @staticmethod
+    def recalculate_room_boundaries_bulk(room_ids):
+        """Recalculate boundaries for many rooms in a fixed number of queries.
+
+        Fetches the rooms and their walls in two queries and persists every
+        recomputed boundary with a single bulk_update, instead of paying a
+        fetch + save round trip per room. Returns the number of rooms updated."""
+        from .models import Room
+        import logging
+
+        logger = logging.getLogger(__name__)
+
+        if not room_ids:
+            return 0
+
+        changed = []
+        for room in Room.objects.filter(id__in=room_ids).prefetch_related('walls'):
+            try:
+                room_points = RoomService._compute_room_boundary(room)
+            except Exception as e:
+                logger.error(f"Error recalculating boundary for room {room.id}: {str(e)}")
+                continue
+            if room_points is None:
+                logger.warning(f"No walls found for room {room.id}")
+                continue
+            room.room_points = room_points
+            changed.append(room)
+
+        if changed:
+            Room.objects.bulk_update(changed, ['room_points'])
+            # bulk_update skips Room post_save, so bump project activity and
+            # drop the version-keyed analysis caches explicitly (same
+            # compensation as update_wall_heights_for_room)
+            from .cache_utils import invalidate_project_analyses
+            from .project_activity import mark_project_edited
+            for project_id in {room.project_id for room in changed}:
+                mark_project_edited(project_id)
+                invalidate_project_analyses(project_id)
+        logger.info(f"Recalculated boundaries for {len(changed)} of {len(room_ids)} rooms")
+        return len(changed)
+
     @staticmethod
     def recalculate_all_room_boundaries(project_id):
         """Recalculate room boundaries for all rooms in a project.
@@ -875,14 +929,10 @@ class RoomService:
         logger.info(f"Recalculating room boundaries for all rooms in project {project_id}")
         
         try:
-            rooms = Room.objects.filter(project_id=project_id)
-            updated_count = 0
-            
-            for room in rooms:
-                if RoomService.recalculate_room_boundary_from_walls(room.id):
-                    updated_count += 1
-            
-            logger.info(f"Successfully updated {updated_count} out of {rooms.count()} rooms")
+            room_ids = list(Room.objects.filter(project_id=project_id).values_list('id', flat=True))
+            updated_count = RoomService.recalculate_room_boundaries_bulk(room_ids)
+
+            logger.info(f"Successfully updated {updated_count} out of {len(room_ids)} rooms")
             return updated_count
             
         except Exception as e:
@@ -954,26 +1004,28 @@ class RoomService:
         walls = Wall.objects.filter(id__in=wall_ids).prefetch_related('rooms')
         logger.info(f"Found {walls.count()} walls to update")
         
-        updated_count = 0
-        
+        updated_walls = []
+
         # Process each wall individually to handle shared walls
         for wall in walls:
             logger.info(f"Processing wall {wall.id}: current height = {wall.height}, storey_id = {wall.storey_id}")
-            
-            # Get rooms that contain this wall, filtered by storey to prevent cross-level contamination
+
+            # Get rooms that contain this wall, filtered by storey to prevent cross-level
+            # contamination. Filter the prefetched rooms in memory — a .filter() here
+            # would bypass the prefetch cache and issue a fresh query per wall.
             if wall.storey_id:
                 # Only consider rooms on the same storey as the wall
-                rooms_containing_wall = wall.rooms.filter(storey_id=wall.storey_id)
-                logger.info(f"Wall {wall.id} (storey {wall.storey_id}) is shared by {rooms_containing_wall.count()} room(s) on the same storey")
+                rooms_containing_wall = [r for r in wall.rooms.all() if r.storey_id == wall.storey_id]
+                logger.info(f"Wall {wall.id} (storey {wall.storey_id}) is shared by {len(rooms_containing_wall)} room(s) on the same storey")
             elif room_storey_id:
                 # If wall has no storey but we have a room storey, use that
-                rooms_containing_wall = wall.rooms.filter(storey_id=room_storey_id)
-                logger.info(f"Wall {wall.id} (no storey) filtered by room storey {room_storey_id}: {rooms_containing_wall.count()} room(s)")
+                rooms_containing_wall = [r for r in wall.rooms.all() if r.storey_id == room_storey_id]
+                logger.info(f"Wall {wall.id} (no storey) filtered by room storey {room_storey_id}: {len(rooms_containing_wall)} room(s)")
             else:
                 # Fallback: only rooms with no storey (legacy data)
-                rooms_containing_wall = wall.rooms.filter(storey__isnull=True)
-                logger.info(f"Wall {wall.id} (no storey, no room_storey_id): {rooms_containing_wall.count()} room(s) with no storey")
-            
+                rooms_containing_wall = [r for r in wall.rooms.all() if r.storey_id is None]
+                logger.info(f"Wall {wall.id} (no storey, no room_storey_id): {len(rooms_containing_wall)} room(s) with no storey")
+
             # Check if any room sharing this wall has allow_variable_wall_heights enabled
             # If so, skip updating this wall to preserve individual wall heights for sloped roofs
             has_variable_heights = any(room.allow_variable_wall_heights for room in rooms_containing_wall)
@@ -997,14 +1049,23 @@ class RoomService:
                 target_height = max(room_heights)
                 logger.info(f"Wall {wall.id} is shared by {len(room_heights)} room(s) on the same storey, using max height: {target_height}")
             
-            # Update the wall height
+            # Update the wall height (persisted in one bulk_update below)
             wall.height = target_height
-            wall.save()
-            updated_count += 1
+            updated_walls.append(wall)
             logger.info(f"Wall {wall.id}: updated to height = {wall.height}")
-        
-        logger.info(f"Updated {updated_count} walls total")
-        return updated_count
+
+        if updated_walls:
+            # One UPDATE for all walls instead of one per wall
+            Wall.objects.bulk_update(updated_walls, ['height'])
+            # bulk_update skips post_save signals, so drop the cached
+            # walls/analysis payloads for the affected projects explicitly
+            from .cache_utils import invalidate_project_analyses, invalidate_project_walls
+            for project_id in {wall.project_id for wall in updated_walls}:
+                invalidate_project_walls(project_id)
+                invalidate_project_analyses(project_id)
+
+        logger.info(f"Updated {len(updated_walls)} walls total")
+        return len(updated_walls)
 
     @staticmethod
     def create_room_with_height(room_data):
@@ -1186,28 +1247,27 @@ class DoorService:
             if field not in door_data:
                 raise ValueError(f'{field} is required for door placement')
 
-        # Validate wall link if provided
+        # Validate wall link if provided. Only the project id is needed, so
+        # fetch that single column instead of the whole wall row.
         wall_id = door_data.get('linked_wall')
         if wall_id:
-            try:
-                wall = Wall.objects.get(pk=wall_id)
-                # Validate that the wall belongs to the same project
-                if str(wall.project.id) != str(door_data['project']):
-                    raise ValueError('Linked wall must belong to the same project')
-            except Wall.DoesNotExist:
+            wall_project_id = (
+                Wall.objects.filter(pk=wall_id)
+                .values_list('project_id', flat=True)
+                .first()
+            )
+            if wall_project_id is None:
                 raise ValueError('Linked wall not found')
+            if str(wall_project_id) != str(door_data['project']):
+                raise ValueError('Linked wall must belong to the same project')
 
     @staticmethod
     def create_door(door_data):
         """Create a door with proper validation and wall linking."""
         DoorService.validate_door_placement(door_data)
-        
-        # Get the linked wall if provided
-        linked_wall = None
-        if door_data.get('linked_wall'):
-            linked_wall = Wall.objects.get(pk=door_data['linked_wall'])
-        
-        # Create the door with all necessary data
+
+        # Create the door with all necessary data. The linked wall was already
+        # validated above, so assign its id directly instead of re-fetching it.
         door = Door.objects.create(
             project_id=door_data['project'],
             door_type=door_data.get('door_type', 'swing'),
@@ -1221,7 +1281,7 @@ class DoorService:
             position_x=door_data['position_x'],
             position_y=door_data['position_y'],
             orientation=door_data.get('orientation', 'horizontal'),
-            linked_wall=linked_wall
+            linked_wall_id=door_data.get('linked_wall') or None
         )
         
         return door 
@@ -1374,12 +1434,13 @@ class FloorService:
         points = room.room_points
         n = len(points)
 
-        # Calculate room area from polygon
+        # Calculate room area from polygon (shoelace, one pass over edge pairs)
         area = 0.0
-        for i in range(n):
-            j = (i + 1) % n
-            area += points[i]['x'] * points[j]['y']
-            area -= points[j]['x'] * points[i]['y']
+        x1, y1 = points[-1]['x'], points[-1]['y']
+        for point in points:
+            x2, y2 = point['x'], point['y']
+            area += x1 * y2 - x2 * y1
+            x1, y1 = x2, y2
         room_area = abs(area) / 2.0
 
         # Default fallback: perimeter * wall_thickness (previous behaviour)
@@ -2016,11 +2077,12 @@ class FloorService:
             if n < 3:
                 return 0
             
-            area = 0
-            for i in range(n):
-                j = (i + 1) % n
-                area += points[i][0] * points[j][1]
-                area -= points[j][0] * points[i][1]
+            # Walk edge pairs directly instead of indexing with (i + 1) % n
+            area = 0.0
+            x1, y1 = points[-1]
+            for x2, y2 in points:
+                area += x1 * y2 - x2 * y1
+                x1, y1 = x2, y2
             
             return abs(area) / 2
             
@@ -2040,11 +2102,16 @@ class FloorService:
             cutout_x = None
             cutout_y = None
             
+            # Extremes are loop-invariant; compute them once instead of four
+            # min/max scans per vertex
+            min_x, max_x = min(x_coords), max(x_coords)
+            min_y, max_y = min(y_coords), max(y_coords)
+            
             # Find the inner corner by looking for a point that's not at the extremes
             for point in points:
                 x, y = point
-                if (x != min(x_coords) and x != max(x_coords) and 
-                    y != min(y_coords) and y != max(y_coords)):
+                if (x != min_x and x != max_x and 
+                    y != min_y and y != max_y):
                     if cutout_x is None or (x > cutout_x and y > cutout_y):
                         cutout_x = x
                         cutout_y = y
@@ -2071,16 +2138,20 @@ class FloorService:
     def _create_floor_vertical_split_regions(x_coords, y_coords, cutout_x, cutout_y):
         """Create floor regions using VERTICAL split at x=cutout_x for maximum panel length (like ceiling plan does)"""
         try:
+            # Extremes are reused across both region dicts; compute once
+            min_x, max_x = min(x_coords), max(x_coords)
+            min_y, max_y = min(y_coords), max(y_coords)
+            
             regions = []
             
             # Region 1: Bottom-left area ONLY (below the cutout)
             region1 = {
-                'min_x': min(x_coords),
+                'min_x': min_x,
                 'max_x': cutout_x,
                 'min_y': cutout_y,  # Start BELOW the cutout
-                'max_y': max(y_coords),
-                'width': cutout_x - min(x_coords),
-                'height': max(y_coords) - cutout_y,  # Only the bottom part
+                'max_y': max_y,
+                'width': cutout_x - min_x,
+                'height': max_y - cutout_y,  # Only the bottom part
                 'type': 'bottom_left_vertical_arm'
             }
             regions.append(region1)
@@ -2088,11 +2159,11 @@ class FloorService:
             # Region 2: Right side (the right arm of L-shape)
             region2 = {
                 'min_x': cutout_x,
-                'max_x': max(x_coords),
-                'min_y': min(y_coords),
-                'max_y': max(y_coords),
-                'width': max(x_coords) - cutout_x,
-                'height': max(y_coords) - min(y_coords),  # FULL height!
+                'max_x': max_x,
+                'min_y': min_y,
+                'max_y': max_y,
+                'width': max_x - cutout_x,
+                'height': max_y - min_y,  # FULL height!
                 'type': 'right_vertical_arm'
             }
             regions.append(region2)
@@ -2106,27 +2177,31 @@ class FloorService:
     def _create_floor_horizontal_split_regions(x_coords, y_coords, cutout_x, cutout_y):
         """Create floor regions using HORIZONTAL split at y=cutout_y (like ceiling plan does)"""
         try:
+            # Extremes are reused across both region dicts; compute once
+            min_x, max_x = min(x_coords), max(x_coords)
+            min_y, max_y = min(y_coords), max(y_coords)
+            
             regions = []
             
             # Region 1: Top-right rectangle (only the right part, not covering the cutout area)
             region1 = {
                 'min_x': cutout_x,  # Start from cutout_x, not min_x
-                'max_x': max(x_coords),
-                'min_y': min(y_coords),
+                'max_x': max_x,
+                'min_y': min_y,
                 'max_y': cutout_y,
-                'width': max(x_coords) - cutout_x,
-                'height': cutout_y - min(y_coords),
+                'width': max_x - cutout_x,
+                'height': cutout_y - min_y,
                 'type': 'top_right_arm'
             }
             regions.append(region1)
             # Region 2: Bottom horizontal strip (full width, below the cutout)
             region2 = {
-                'min_x': min(x_coords),
-                'max_x': max(x_coords),
+                'min_x': min_x,
+                'max_x': max_x,
                 'min_y': cutout_y,
-                'max_y': max(y_coords),
-                'width': max(x_coords) - min(x_coords),
-                'height': max(y_coords) - cutout_y,
+                'max_y': max_y,
+                'width': max_x - min_x,
+                'height': max_y - cutout_y,
                 'type': 'bottom_arm'
             }
             regions.append(region2)
@@ -2204,19 +2279,19 @@ class FloorService:
     def _is_point_in_polygon(x, y, polygon_points):
         """Check if a point is inside a polygon using ray casting algorithm
         This is the same method used by the ceiling plan for L-shaped room handling"""
-        n = len(polygon_points)
         inside = False
         
-        p1x, p1y = polygon_points[0]['x'], polygon_points[0]['y']
-        for i in range(n + 1):
-            p2x, p2y = polygon_points[i % n]['x'], polygon_points[i % n]['y']
-            if y > min(p1y, p2y):
-                if y <= max(p1y, p2y):
-                    if x <= max(p1x, p2x):
-                        if p1y != p2y:
-                            xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                        if p1x == p2x or x <= xinters:
-                            inside = not inside
+        # Walk edge pairs with a carried previous vertex; (y > p1y) != (y > p2y)
+        # is the same half-open straddle test as min < y <= max without the
+        # min/max calls, and the crossing x always lies between p1x and p2x so
+        # the separate x-bound precheck is subsumed by x <= xinters.
+        p1x, p1y = polygon_points[-1]['x'], polygon_points[-1]['y']
+        for point in polygon_points:
+            p2x, p2y = point['x'], point['y']
+            if (y > p1y) != (y > p2y):
+                xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
+                if x <= xinters:
+                    inside = not inside
             p1x, p1y = p2x, p2y
         
         return inside
@@ -2754,23 +2829,28 @@ class FloorService:
                     # Check if room has panel floor
                     if hasattr(room, 'floor_type') and room.floor_type in ['panel', 'Panel']:
                         # Calculate room area using Shoelace formula
-                        area = 0
-                        for i in range(len(room.room_points)):
-                            j = (i + 1) % len(room.room_points)
-                            area += room.room_points[i]['x'] * room.room_points[j]['y']
-                            area -= room.room_points[j]['x'] * room.room_points[i]['y']
+                        area = 0.0
+                        pts = room.room_points
+                        x1, y1 = pts[-1]['x'], pts[-1]['y']
+                        for point in pts:
+                            x2, y2 = point['x'], point['y']
+                            area += x1 * y2 - x2 * y1
+                            x1, y1 = x2, y2
                         room_area = abs(area) / 2
                         total_room_area += room_area
             
             if total_room_area > 0 and leftover_area > 0:
                 project_waste_percentage = (leftover_area / total_room_area) * 100
-                print(f"🎯 [PROJECT] Floor Plan Project-wide waste calculation:")
-                print(f"🎯 [PROJECT] Total Room Area: {total_room_area:,.0f} mm²")
-                print(f"🎯 [PROJECT] Total Leftover Area: {leftover_area:,.0f} mm²")
-                print(f"🎯 [PROJECT] Project Waste Percentage: {project_waste_percentage:.1f}%")
+                logger.debug(
+                    "Floor plan project waste: room_area=%.0f leftover_area=%.0f waste=%.1f%%",
+                    total_room_area, leftover_area, project_waste_percentage,
+                )
             else:
                 project_waste_percentage = 0.0
-                print(f"⚠️ [PROJECT] Cannot calculate floor plan project waste: room_area={total_room_area}, leftover_area={leftover_area}")
+                logger.debug(
+                    "Cannot calculate floor plan project waste: room_area=%s, leftover_area=%s",
+                    total_room_area, leftover_area,
+                )
             
             # Get all actual FloorPanel objects from the database
             from .serializers import FloorPanelSerializer
@@ -2782,7 +2862,6 @@ class FloorService:
                 for panel in room_panels:
                     # Serialize each panel to get the proper format
                     panel_data = FloorPanelSerializer(panel).data
-                    print(f"🔍 Panel {panel.panel_id}: {panel_data}")
                     actual_floor_panels.append(panel_data)
             
            
@@ -3871,13 +3950,12 @@ class CeilingService:
                 if not isinstance(point['x'], (int, float)) or not isinstance(point['y'], (int, float)):
                     return 0.0
             
-            n = len(room_points)
             area = 0.0
-            
-            for i in range(n):
-                j = (i + 1) % n
-                area += room_points[i]['x'] * room_points[j]['y']
-                area -= room_points[j]['x'] * room_points[i]['y']
+            x1, y1 = room_points[-1]['x'], room_points[-1]['y']
+            for point in room_points:
+                x2, y2 = point['x'], point['y']
+                area += x1 * y2 - x2 * y1
+                x1, y1 = x2, y2
             
             return abs(area) / 2.0
         except Exception as e:
@@ -3892,13 +3970,16 @@ class CeilingService:
         x_coords = [point['x'] for point in room_points]
         y_coords = [point['y'] for point in room_points]
         
+        min_x, max_x = min(x_coords), max(x_coords)
+        min_y, max_y = min(y_coords), max(y_coords)
+        
         return {
-            'min_x': min(x_coords),
-            'max_y': max(y_coords),
-            'max_x': max(x_coords),
-            'min_y': min(y_coords),
-            'width': max(x_coords) - min(x_coords),
-            'height': max(y_coords) - min(y_coords)
+            'min_x': min_x,
+            'max_y': max_y,
+            'max_x': max_x,
+            'min_y': min_y,
+            'width': max_x - min_x,
+            'height': max_y - min_y
         }
     
     @staticmethod
@@ -3962,18 +4043,18 @@ class CeilingService:
     @staticmethod
     def _is_point_in_polygon(x, y, polygon_points):
         """Ray casting algorithm to check if point is in polygon"""
-        n = len(polygon_points)
         inside = False
-        p1x, p1y = polygon_points[0]['x'], polygon_points[0]['y']
-        for i in range(n + 1):
-            p2x, p2y = polygon_points[i % n]['x'], polygon_points[i % n]['y']
-            if y > min(p1y, p2y):
-                if y <= max(p1y, p2y):
-                    if x <= max(p1x, p2x):
-                        if p1y != p2y:
-                            xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                        if p1x == p2x or x <= xinters:
-                            inside = not inside
+        # Walk edge pairs with a carried previous vertex; (y > p1y) != (y > p2y)
+        # is the same half-open straddle test as min < y <= max without the
+        # min/max calls, and the crossing x always lies between p1x and p2x so
+        # the separate x-bound precheck is subsumed by x <= xinters.
+        p1x, p1y = polygon_points[-1]['x'], polygon_points[-1]['y']
+        for point in polygon_points:
+            p2x, p2y = point['x'], point['y']
+            if (y > p1y) != (y > p2y):
+                xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
+                if x <= xinters:
+                    inside = not inside
             p1x, p1y = p2x, p2y
         return inside
     
@@ -5333,11 +5414,12 @@ class CeilingService:
             if n < 3:
                 return 0
             
-            area = 0
-            for i in range(n):
-                j = (i + 1) % n
-                area += points[i][0] * points[j][1]
-                area -= points[j][0] * points[i][1]
+            # Walk edge pairs directly instead of indexing with (i + 1) % n
+            area = 0.0
+            x1, y1 = points[-1]
+            for x2, y2 in points:
+                area += x1 * y2 - x2 * y1
+                x1, y1 = x2, y2
             
             return abs(area) / 2
             
@@ -5357,11 +5439,16 @@ class CeilingService:
             cutout_x = None
             cutout_y = None
             
+            # Extremes are loop-invariant; compute them once instead of four
+            # min/max scans per vertex
+            min_x, max_x = min(x_coords), max(x_coords)
+            min_y, max_y = min(y_coords), max(y_coords)
+            
             # Find the inner corner by looking for a point that's not at the extremes
             for point in points:
                 x, y = point
-                if (x != min(x_coords) and x != max(x_coords) and 
-                    y != min(y_coords) and y != max(y_coords)):
+                if (x != min_x and x != max_x and 
+                    y != min_y and y != max_y):
                     if cutout_x is None or (x > cutout_x and y > cutout_y):
                         cutout_x = x
                         cutout_y = y
@@ -5389,17 +5476,21 @@ class CeilingService:
     def _create_vertical_split_regions(x_coords, y_coords, cutout_x, cutout_y):
         """Create regions using VERTICAL split at x=cutout_x for maximum panel length"""
         try:
+            # Extremes are reused across both region dicts; compute once
+            min_x, max_x = min(x_coords), max(x_coords)
+            min_y, max_y = min(y_coords), max(y_coords)
+            
             regions = []
             
             # Region 1: Bottom-left area ONLY (below Room 144)
             # From x=0 to x=cutout_x, from y=cutout_y to y=max (NOT full height!)
             region1 = {
-                'min_x': min(x_coords),
+                'min_x': min_x,
                 'max_x': cutout_x,
                 'min_y': cutout_y,  # Start BELOW Room 144
-                'max_y': max(y_coords),
-                'width': cutout_x - min(x_coords),
-                'height': max(y_coords) - cutout_y,  # Only the bottom part
+                'max_y': max_y,
+                'width': cutout_x - min_x,
+                'height': max_y - cutout_y,  # Only the bottom part
                 'type': 'bottom_left_vertical_arm'
             }
             regions.append(region1)
@@ -5408,11 +5499,11 @@ class CeilingService:
             # From x=cutout_x to x=max, full height - THIS GETS 10000mm LENGTH!
             region2 = {
                 'min_x': cutout_x,
-                'max_x': max(x_coords),
-                'min_y': min(y_coords),
-                'max_y': max(y_coords),
-                'width': max(x_coords) - cutout_x,
-                'height': max(y_coords) - min(y_coords),  # FULL 10000mm!
+                'max_x': max_x,
+                'min_y': min_y,
+                'max_y': max_y,
+                'width': max_x - cutout_x,
+                'height': max_y - min_y,  # FULL 10000mm!
                 'type': 'right_vertical_arm'
             }
             regions.append(region2)
@@ -5426,28 +5517,32 @@ class CeilingService:
     def _create_horizontal_split_regions(x_coords, y_coords, cutout_x, cutout_y):
         """Create regions using HORIZONTAL split at y=cutout_y (current approach)"""
         try:
+            # Extremes are reused across both region dicts; compute once
+            min_x, max_x = min(x_coords), max(x_coords)
+            min_y, max_y = min(y_coords), max(y_coords)
+            
             regions = []
             
             # Region 1: Top-right rectangle (only the right part, not covering Room 144)
             region1 = {
                 'min_x': cutout_x,  # Start from cutout_x (8036), not min_x (0)
-                'max_x': max(x_coords),
-                'min_y': min(y_coords),
+                'max_x': max_x,
+                'min_y': min_y,
                 'max_y': cutout_y,
-                'width': max(x_coords) - cutout_x,
-                'height': cutout_y - min(y_coords),
+                'width': max_x - cutout_x,
+                'height': cutout_y - min_y,
                 'type': 'top_right_arm'
             }
             regions.append(region1)
             
             # Region 2: Bottom horizontal strip (full width, below Room 144)
             region2 = {
-                'min_x': min(x_coords),
-                'max_x': max(x_coords),
+                'min_x': min_x,
+                'max_x': max_x,
                 'min_y': cutout_y,
-                'max_y': max(y_coords),
-                'width': max(x_coords) - min(x_coords),
-                'height': max(y_coords) - cutout_y,
+                'max_y': max_y,
+                'width': max_x - min_x,
+                'height': max_y - cutout_y,
                 'type': 'bottom_arm'
             }
             regions.append(region2)
@@ -5725,17 +5820,22 @@ class CeilingService:
         try:
             optimized_panels = []
             
+            # Shared across all panels of this room; neighbouring panels share
+            # corners and the adjust pass re-tests the same points
+            point_cache = {}
+            
             for panel in panels:
                 # Check if panel is fully within room boundaries
                 panel_coverage = CeilingService._calculate_enhanced_panel_coverage(
                     panel['start_x'], panel['start_y'], 
-                    panel['width'], panel['length'], room_points
+                    panel['width'], panel['length'], room_points,
+                    point_cache=point_cache
                 )
                 
                 if panel_coverage > 0.5:  # Only keep panels with >50% coverage
                     # Adjust panel dimensions to fit within room
                     adjusted_panel = CeilingService._adjust_panel_to_room_boundaries(
-                        panel, room_points
+                        panel, room_points, point_cache=point_cache
                     )
                     
                     if adjusted_panel:
@@ -5747,7 +5847,7 @@ class CeilingService:
             return panels
 
     @staticmethod
-    def _adjust_panel_to_room_boundaries(panel, room_points):
+    def _adjust_panel_to_room_boundaries(panel, room_points, point_cache=None):
         """Adjust panel dimensions to fit within room boundaries"""
         try:
             # This is a simplified adjustment - in a full implementation,
@@ -5756,7 +5856,8 @@ class CeilingService:
             # For now, we'll just check if the panel is mostly within the room
             panel_coverage = CeilingService._calculate_enhanced_panel_coverage(
                 panel['start_x'], panel['start_y'], 
-                panel['width'], panel['length'], room_points
+                panel['width'], panel['length'], room_points,
+                point_cache=point_cache
             )
             
             if panel_coverage > 0.8:
@@ -6277,13 +6378,16 @@ class CeilingService:
         x_coords = [point['x'] for point in all_points]
         y_coords = [point['y'] for point in all_points]
         
+        min_x, max_x = min(x_coords), max(x_coords)
+        min_y, max_y = min(y_coords), max(y_coords)
+        
         return {
-            'min_x': min(x_coords),
-            'max_y': max(y_coords),
-            'max_x': max(x_coords),
-            'min_y': min(y_coords),
-            'width': max(x_coords) - min(x_coords),
-            'height': max(y_coords) - min(y_coords)
+            'min_x': min_x,
+            'max_y': max_y,
+            'max_x': max_x,
+            'min_y': min_y,
+            'width': max_x - min_x,
+            'height': max_y - min_y
         }
 
     @staticmethod
@@ -7220,29 +7324,44 @@ class CeilingService:
         return panels
 
     @staticmethod
-    def _calculate_enhanced_panel_coverage(start_x, start_y, width, height, room_points):
-        """Calculate enhanced panel coverage within room boundaries"""
+    def _calculate_enhanced_panel_coverage(start_x, start_y, width, height, room_points, point_cache=None):
+        """Calculate enhanced panel coverage within room boundaries
+        
+        point_cache, when provided, memoizes point classifications across
+        calls for the same room: adjacent panels share corners, and the
+        optimize/adjust passes test the same panel twice.
+        """
         try:
-            # Create panel corners
-            panel_corners = [
-                {'x': start_x, 'y': start_y},
-                {'x': start_x + width, 'y': start_y},
-                {'x': start_x + width, 'y': start_y + height},
-                {'x': start_x, 'y': start_y + height}
-            ]
+            def _inside(px, py):
+                if point_cache is None:
+                    return CeilingService._is_point_in_polygon(px, py, room_points)
+                key = (px, py)
+                result = point_cache.get(key)
+                if result is None:
+                    result = CeilingService._is_point_in_polygon(px, py, room_points)
+                    point_cache[key] = result
+                return result
             
             # Calculate panel center
             center_x = start_x + width / 2
             center_y = start_y + height / 2
             
             # Check if panel center is within room
-            if CeilingService._is_point_in_polygon(center_x, center_y, room_points):
+            if _inside(center_x, center_y):
                 return 1.0  # Full coverage
             
+            # Only build the corners once the center check has failed
+            panel_corners = [
+                {'x': start_x, 'y': start_y},
+                {'x': start_x + width, 'y': start_y},
+                {'x': start_x + width, 'y': start_y + height},
+                {'x': start_x, 'y': start_y + height}
+            ]
+            
             # Check corner coverage
             corners_in_room = 0
             for corner in panel_corners:
-                if CeilingService._is_point_in_polygon(corner['x'], corner['y'], room_points):
+                if _inside(corner['x'], corner['y']):
                     corners_in_room += 1
             
             # Calculate coverage based on corners
@@ -7866,84 +7985,79 @@ class CeilingService:
             return []
 
     @staticmethod
-    def export_ceiling_report_to_csv(project_id, report_data=None):
-        """Export ceiling report to CSV format"""
-        try:
-            import csv
-            from io import StringIO
-            
-            if not report_data:
-                report_data = CeilingService.generate_project_ceiling_report(project_id)
-            
-            if 'error' in report_data:
-                return {'error': report_data['error']}
-            
-            # Create CSV content
-            output = StringIO()
-            writer = csv.writer(output)
-            
-            # Write header
-            writer.writerow(['Project Ceiling Report'])
-            writer.writerow(['Project:', report_data['project_name']])
-            writer.writerow(['Generated:', report_data['report_timestamp']])
-            writer.writerow([])
-            
-            # Write summary
-            summary = report_data['summary']
-            writer.writerow(['SUMMARY'])
-            writer.writerow(['Total Rooms', 'Total Panels', 'Total Area (mm²)', 'Waste %', 'Efficiency Score'])
-            writer.writerow([
-                summary['total_rooms'],
-                summary['total_panels'],
-                summary['total_area'],
-                f"{summary['total_waste_percentage']:.2f}%",
-                f"{summary['efficiency_score']:.1f}"
-            ])
-            writer.writerow([])
-            
-            # Write room details
-            writer.writerow(['ROOM DETAILS'])
-            writer.writerow([
-                'Room Name', 'Height (mm)', 'Area (mm²)', 'Panels', 'Orientation', 
-                'Recommended', 'Waste %', 'Waste Area (mm²)'
+    def ceiling_report_csv_filename(report_data):
+        """Build the download filename for a ceiling report CSV."""
+        project_name = report_data['project_name'].replace(' ', '_')
+        return f"ceiling_report_{project_name}_{timezone.now().strftime('%Y%m%d_%H%M%S')}.csv"
+
+    @staticmethod
+    def iter_ceiling_report_csv(report_data):
+        """Yield CSV rows for a ceiling report, one at a time.
+
+        Uses the pseudo-buffer pattern from the Django streaming-CSV docs so
+        the rows can feed a StreamingHttpResponse directly: peak memory stays
+        at one row instead of the whole report string, and the first byte
+        goes out as soon as the first row is written."""
+        import csv
+
+        class _Echo:
+            """File-like object that hands each written row straight back."""
+            def write(self, value):
+                return value
+
+        writer = csv.writer(_Echo())
+
+        # Write header
+        yield writer.writerow(['Project Ceiling Report'])
+        yield writer.writerow(['Project:', report_data['project_name']])
+        yield writer.writerow(['Generated:', report_data['report_timestamp']])
+        yield writer.writerow([])
+
+        # Write summary
+        summary = report_data['summary']
+        yield writer.writerow(['SUMMARY'])
+        yield writer.writerow(['Total Rooms', 'Total Panels', 'Total Area (mm²)', 'Waste %', 'Efficiency Score'])
+        yield writer.writerow([
+            summary['total_rooms'],
+            summary['total_panels'],
+            summary['total_area'],
+            f"{summary['total_waste_percentage']:.2f}%",
+            f"{summary['efficiency_score']:.1f}"
+        ])
+        yield writer.writerow([])
+
+        # Write room details
+        yield writer.writerow(['ROOM DETAILS'])
+        yield writer.writerow([
+            'Room Name', 'Height (mm)', 'Area (mm²)', 'Panels', 'Orientation', 
+            'Recommended', 'Waste %', 'Waste Area (mm²)'
+        ])
+
+        for room in report_data['room_reports']:
+            yield writer.writerow([
+                room['room_name'],
+                room['room_height'] or 'Default',
+                room['room_area'],
+                room['total_panels'],
+                room['orientation'],
+                'Yes' if room['is_recommended_orientation'] else 'No',
+                f"{room['waste_percentage']:.2f}%",
+                room['waste_area']
             ])
-            
-            for room in report_data['room_reports']:
-                writer.writerow([
-                    room['room_name'],
-                    room['room_height'] or 'Default',
-                    room['room_area'],
-                    room['total_panels'],
-                    room['orientation'],
-                    'Yes' if room['is_recommended_orientation'] else 'No',
-                    f"{room['waste_percentage']:.2f}%",
-                    room['waste_area']
+
+        # Write recommendations
+        if report_data['recommendations']:
+            yield writer.writerow([])
+            yield writer.writerow(['RECOMMENDATIONS'])
+            yield writer.writerow(['Priority', 'Title', 'Description', 'Action'])
+
+            for rec in report_data['recommendations']:
+                yield writer.writerow([
+                    rec['priority'].upper(),
+                    rec['title'],
+                    rec['description'],
+                    rec['action']
                 ])
-            
-            # Write recommendations
-            if report_data['recommendations']:
-                writer.writerow([])
-                writer.writerow(['RECOMMENDATIONS'])
-                writer.writerow(['Priority', 'Title', 'Description', 'Action'])
-                
-                for rec in report_data['recommendations']:
-                    writer.writerow([
-                        rec['priority'].upper(),
-                        rec['title'],
-                        rec['description'],
-                        rec['action']
-                    ])
-            
-            csv_content = output.getvalue()
-            output.close()
-            
-            return {
-                'csv_content': csv_content,
-                'filename': f"ceiling_report_{report_data['project_name'].replace(' ', '_')}_{timezone.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            }
-            
-        except Exception as e:
-            return {'error': f'CSV export failed: {str(e)}'}
 
     @staticmethod
     def generate_ceiling_plan_visualization_data(project_id, room_id=None):
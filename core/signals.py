@@ -1,8 +1,13 @@
 """Signal handlers that mark a project as edited when related content changes."""
 
-from django.db.models.signals import post_delete, post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 
+from .cache_utils import (
+    invalidate_project_analyses,
+    invalidate_project_doors,
+    invalidate_project_walls,
+)
 from .project_activity import mark_project_edited, resolve_project_id
 
 
@@ -58,3 +63,77 @@ def connect_project_activity_signals():
             sender=model,
             dispatch_uid=f'core_touch_project_on_delete_{model.__name__}',
         )
+
+
+def _invalidate_walls_cache(instance, **kwargs):
+    if kwargs.get('raw'):
+        return
+    invalidate_project_walls(resolve_project_id(instance))
+
+
+def _invalidate_doors_cache(instance, **kwargs):
+    if kwargs.get('raw'):
+        return
+    invalidate_project_doors(resolve_project_id(instance))
+
+
+def _invalidate_walls_cache_on_room_walls(instance, **kwargs):
+    # The cached walls payload embeds each wall's room ids, so changes to the
+    # Room<->Wall m2m must also drop it.
+    invalidate_project_walls(resolve_project_id(instance))
+    invalidate_project_analyses(resolve_project_id(instance))
+
+
+def _invalidate_analyses_cache(instance, **kwargs):
+    if kwargs.get('raw'):
+        return
+    invalidate_project_analyses(resolve_project_id(instance))
+
+
+def connect_project_cache_signals():
+    from .models import Door, Room, Wall, WallWindow, Window
+
+    # Walls payload includes nested wall windows and room memberships.
+    for model in (Wall, WallWindow):
+        post_save.connect(
+            _invalidate_walls_cache,
+            sender=model,
+            dispatch_uid=f'core_walls_cache_on_save_{model.__name__}',
+        )
+        post_delete.connect(
+            _invalidate_walls_cache,
+            sender=model,
+            dispatch_uid=f'core_walls_cache_on_delete_{model.__name__}',
+        )
+    m2m_changed.connect(
+        _invalidate_walls_cache_on_room_walls,
+        sender=Room.walls.through,
+        dispatch_uid='core_walls_cache_on_room_walls',
+    )
+
+    # Height/orientation analyses are computed from the wall/room graph, so
+    # any wall or room mutation bumps the project's analysis version.
+    for model in (Wall, Room):
+        post_save.connect(
+            _invalidate_analyses_cache,
+            sender=model,
+            dispatch_uid=f'core_analyses_cache_on_save_{model.__name__}',
+        )
+        post_delete.connect(
+            _invalidate_analyses_cache,
+            sender=model,
+            dispatch_uid=f'core_analyses_cache_on_delete_{model.__name__}',
+        )
+
+    # Doors payload includes nested door windows.
+    for model in (Door, Window):
+        post_save.connect(
+            _invalidate_doors_cache,
+            sender=model,
+            dispatch_uid=f'core_doors_cache_on_save_{model.__name__}',
+        )
+        post_delete.connect(
+            _invalidate_doors_cache,
+            sender=model,
+            dispatch_uid=f'core_doors_cache_on_delete_{model.__name__}',
+        )
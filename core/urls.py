@@ -1,5 +1,5 @@
 from django.urls import path, include
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 from .auth_views import (
     current_user_view,
     list_users_view,
@@ -33,7 +33,9 @@ from .views import (
 )
 
 # Create a router for registering viewsets
-router = DefaultRouter()
+# SimpleRouter skips DefaultRouter's API root view and format-suffix
+# patterns, keeping the URL pattern list (and per-request resolve cost) lean.
+router = SimpleRouter()
 router.register(r'projects', ProjectViewSet, basename='project')
 router.register(r'project-folders', ProjectFolderViewSet, basename='project-folder')
 router.register(r'walls', WallViewSet, basename='wall')
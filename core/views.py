@@ -1,7 +1,10 @@
 import logging
 
+from django.db import transaction
 from django.db.models import Q, Max
 from django.middleware.csrf import get_token
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import etag
 from rest_framework import serializers, viewsets, status
 from rest_framework.response import Response
 from rest_framework.decorators import action, api_view, permission_classes
@@ -12,15 +15,50 @@ from .serializers import (
     CeilingPanelSerializer, CeilingPlanSerializer, FloorPanelSerializer, FloorPlanSerializer,
     DoorSerializer, WindowSerializer, WallWindowSerializer, IntersectionSerializer, CeilingZoneSerializer,
     ProjectCommentSerializer, PlanAnnotationSerializer,
+    SplitWallInputSerializer, MergeWallsInputSerializer, SetJointInputSerializer,
+    ProjectAnalysisInputSerializer,
 )
+from . import cache_utils
 from .comment_utils import get_unread_comment_counts, mark_project_comments_read
+from .pagination import OptionalCursorPagination
 from .permissions import CanAddProjectComment, PlanAnnotationPermission
+from .project_activity import mark_project_edited
 from .role_utils import user_can_edit
-from .services import WallService, RoomService, DoorService, CeilingService, FloorService, normalize_wall_coordinates
+from .services import WallService, RoomService, DoorService, CeilingService, FloorService
 
 
 logger = logging.getLogger(__name__)
 
+# Accepted ceiling panel length options (O(1) membership, shared by both
+# ceiling-plan generation actions)
+VALID_PANEL_LENGTH_OPTIONS = frozenset((1, 2, 3, 4, 5))
+
+# Constant 500 body: unexpected errors are logged with their traceback, not
+# echoed back to the client.
+_ERROR_500 = {'error': 'Internal server error'}
+
+
+def _project_etag(request, pk=None, **kwargs):
+    """ETag for project-derived read-only endpoints.
+
+    Every mutation of project content (walls, rooms, plans, panels, ...)
+    bumps Project.updated_at through the activity signals, so one indexed
+    SELECT yields a validator covering the whole project graph. A matching
+    If-None-Match lets the view answer 304 without recomputing or
+    reserializing anything.
+    """
+    project_id = pk or request.GET.get('project_id')
+    if not project_id:
+        return None
+    updated_at = (
+        Project.objects.filter(pk=project_id)
+        .values_list('updated_at', flat=True)
+        .first()
+    )
+    if updated_at is None:
+        return None
+    return f'{project_id}-{updated_at.timestamp()}'
+
 
 class ProjectViewSet(viewsets.ModelViewSet):
     queryset = Project.objects.all()
@@ -122,36 +160,48 @@ class ProjectViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         user = request.user if request.user.is_authenticated else None
-        project = serializer.save(created_by=user, last_edited_by=user)
 
-        # Create default walls using the service
-        # Ensure a default ground-floor storey exists
-        default_storey, _ = Storey.objects.get_or_create(
-            project=project,
-            order=0,
-            defaults={
-                'name': 'Ground Floor',
-                'elevation_mm': 0.0,
-                'default_room_height_mm': project.height if project.height else 3000.0,
-            },
-        )
+        # Commit the project together with its derived defaults so a failure
+        # partway through never leaves a project without its boundary walls.
+        # The editor fetches walls immediately after create, so this stays
+        # synchronous; this deployment runs no task-queue worker to defer to.
+        with transaction.atomic():
+            project = serializer.save(created_by=user, last_edited_by=user)
+
+            # Create default walls using the service
+            # Ensure a default ground-floor storey exists
+            default_storey, _ = Storey.objects.get_or_create(
+                project=project,
+                order=0,
+                defaults={
+                    'name': 'Ground Floor',
+                    'elevation_mm': 0.0,
+                    'default_room_height_mm': project.height if project.height else 3000.0,
+                },
+            )
 
-        WallService.create_default_walls(project, storey=default_storey)
+            WallService.create_default_walls(project, storey=default_storey)
         return self._list_project_response(project, status.HTTP_201_CREATED)
 
     @action(detail=True, methods=['get'])
+    @method_decorator(etag(_project_etag))
     def walls(self, request, pk=None):
         """Retrieve walls associated with a specific project"""
         try:
-            if not Project.objects.filter(pk=pk).exists():
-                return Response({'error': 'Project not found'}, status=status.HTTP_404_NOT_FOUND)
-            walls = (
-                Wall.objects
-                .filter(project_id=pk)
-                .prefetch_related('windows', 'rooms')
-            )
-            serializer = WallSerializer(walls, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            cache_key = cache_utils.project_walls_cache_key(pk)
+            data = cache_utils.get_cached_project_response(cache_key)
+            if data is None:
+                if not Project.objects.filter(pk=pk).exists():
+                    return Response({'error': 'Project not found'}, status=status.HTTP_404_NOT_FOUND)
+                walls = (
+                    Wall.objects
+                    .filter(project_id=pk)
+                    .prefetch_related('windows', 'rooms')
+                )
+                # Plain list pickles faster than DRF's ReturnList wrapper
+                data = list(WallSerializer(walls, many=True).data)
+                cache_utils.set_cached_project_response(cache_key, data)
+            return Response(data, status=status.HTTP_200_OK)
         except Project.DoesNotExist:
             return Response({'error': 'Project not found'}, status=status.HTTP_404_NOT_FOUND)
 
@@ -335,88 +385,84 @@ def csrf_token_view(request):
     return Response({'csrfToken': get_token(request)})
 
 class WallViewSet(viewsets.ModelViewSet):
-    queryset = Wall.objects.all().prefetch_related('windows')
+    queryset = Wall.objects.all().prefetch_related('windows', 'rooms')
     serializer_class = WallSerializer
+    pagination_class = OptionalCursorPagination
 
     def get_queryset(self):
         """Optionally filter walls by project ID"""
         project_id = self.request.query_params.get('project')
         if project_id:
-            return Wall.objects.filter(project_id=project_id).prefetch_related('windows', 'rooms')
-        return super().get_queryset()
+            queryset = Wall.objects.filter(project_id=project_id).prefetch_related('windows', 'rooms')
+        else:
+            queryset = super().get_queryset()
+        if self.action == 'list':
+            # WallSerializer never exposes the timestamps; skip fetching them
+            # for the high-cardinality list responses.
+            queryset = queryset.defer('created_at', 'updated_at')
+        return queryset
 
     def create(self, request, *args, **kwargs):
         """Create a new wall with normalized coordinates"""
-        # Normalize wall coordinates before validation
-        data = request.data.copy()
-        if 'start_x' in data and 'start_y' in data and 'end_x' in data and 'end_y' in data:
-            norm_start_x, norm_start_y, norm_end_x, norm_end_y = normalize_wall_coordinates(
-                data['start_x'], data['start_y'], data['end_x'], data['end_y']
-            )
-            data['start_x'] = norm_start_x
-            data['start_y'] = norm_start_y
-            data['end_x'] = norm_end_x
-            data['end_y'] = norm_end_y
-
-        serializer = self.get_serializer(data=data)
+        # Coordinates are normalized in WallSerializer.validate
+        serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         wall = serializer.save()
         
         # If user provided base_elevation_mm, mark it as manual and skip auto-update
         # Otherwise, auto-update based on room relationships
-        from .services import WallService
         if 'base_elevation_mm' in request.data:
             wall.base_elevation_manual = True
             wall.save(update_fields=['base_elevation_manual'])
-        else:
-            WallService.update_wall_base_elevations([wall.id])
-        
-        # Refresh the wall to get updated base_elevation_mm
-        wall.refresh_from_db()
-        return Response(WallSerializer(wall).data, status=status.HTTP_201_CREATED)
+        elif WallService.update_wall_base_elevations([wall.id]):
+            # Refresh only when the auto-update actually changed the wall
+            wall.refresh_from_db()
+        # serializer.data is built lazily from the (possibly refreshed)
+        # instance, so no second serializer pass is needed.
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
 
     def update(self, request, *args, **kwargs):
         """Update wall properties"""
         instance = self.get_object()
-        data = request.data.copy()
-        if all(key in data for key in ('start_x', 'start_y', 'end_x', 'end_y')):
-            norm_start_x, norm_start_y, norm_end_x, norm_end_y = normalize_wall_coordinates(
-                data['start_x'], data['start_y'], data['end_x'], data['end_y']
-            )
-            data['start_x'] = norm_start_x
-            data['start_y'] = norm_start_y
-            data['end_x'] = norm_end_x
-            data['end_y'] = norm_end_y
-        serializer = self.get_serializer(instance, data=data, partial=True)
+        # Coordinates are normalized in WallSerializer.validate
+        serializer = self.get_serializer(instance, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
-        serializer.save()
-        
-        # If user provided base_elevation_mm, mark it as manual and skip auto-update
-        # Otherwise, auto-update based on room relationships (will respect existing manual flag)
-        from .services import WallService
-        if 'base_elevation_mm' in request.data:
-            instance.base_elevation_manual = True
-            instance.save(update_fields=['base_elevation_manual'])
-        else:
-            WallService.update_wall_base_elevations([instance.id])
-        
-        # After updating a wall, recalculate room boundaries ONLY for rooms on the same storey
-        # This prevents cross-level contamination when editing walls on different levels
-        from .services import RoomService
-        rooms_with_wall = instance.rooms.all()
-        
-        # Filter rooms by the wall's storey to prevent affecting other levels
-        if instance.storey_id:
-            # Only recalculate rooms on the same storey as the wall
-            rooms_to_update = rooms_with_wall.filter(storey_id=instance.storey_id)
-        else:
-            # If wall has no storey, only update rooms that also have no storey
-            # (This handles legacy data or unassigned walls)
-            rooms_to_update = rooms_with_wall.filter(storey__isnull=True)
-        
-        for room in rooms_to_update:
-            RoomService.recalculate_room_boundary_from_walls(room.id)
-        
+
+        # One transaction for the wall write, derived elevation updates and
+        # boundary recalculation: a single commit instead of one per statement,
+        # and no partially-updated wall on error.
+        with transaction.atomic():
+            serializer.save()
+
+            # If user provided base_elevation_mm, mark it as manual and skip auto-update
+            # Otherwise, auto-update based on room relationships (will respect existing manual flag)
+            if 'base_elevation_mm' in request.data:
+                instance.base_elevation_manual = True
+                instance.save(update_fields=['base_elevation_manual'])
+            else:
+                WallService.update_wall_base_elevations([instance.id])
+
+            # After updating a wall, recalculate room boundaries ONLY for rooms on
+            # the same storey (prevents cross-level contamination when editing
+            # walls on different levels), and only when the patch actually moved
+            # an endpoint — height/thickness-only edits don't change geometry.
+            geometry_fields = {'start_x', 'start_y', 'end_x', 'end_y'}
+            if geometry_fields & set(serializer.validated_data):
+                rooms_with_wall = instance.rooms.all()
+
+                # Filter rooms by the wall's storey to prevent affecting other levels
+                if instance.storey_id:
+                    # Only recalculate rooms on the same storey as the wall
+                    rooms_to_update = rooms_with_wall.filter(storey_id=instance.storey_id)
+                else:
+                    # If wall has no storey, only update rooms that also have no storey
+                    # (This handles legacy data or unassigned walls)
+                    rooms_to_update = rooms_with_wall.filter(storey__isnull=True)
+
+                RoomService.recalculate_room_boundaries_bulk(
+                    list(rooms_to_update.values_list('id', flat=True))
+                )
+
         return Response(serializer.data)
 
     @action(detail=False, methods=['post'])
@@ -426,62 +472,49 @@ class WallViewSet(viewsets.ModelViewSet):
         if not project_id:
             return Response({'error': 'Project ID is required'}, status=status.HTTP_400_BAD_REQUEST)
 
-        try:
-            project = Project.objects.get(pk=project_id)
-        except Project.DoesNotExist:
-            return Response({'error': 'Project not found'}, status=status.HTTP_404_NOT_FOUND)
-
-        # Normalize wall coordinates before validation
-        data = request.data.copy()
-        if 'start_x' in data and 'start_y' in data and 'end_x' in data and 'end_y' in data:
-            norm_start_x, norm_start_y, norm_end_x, norm_end_y = normalize_wall_coordinates(
-                data['start_x'], data['start_y'], data['end_x'], data['end_y']
-            )
-            data['start_x'] = norm_start_x
-            data['start_y'] = norm_start_y
-            data['end_x'] = norm_end_x
-            data['end_y'] = norm_end_y
-
-        serializer = self.get_serializer(data=data)
+        # Coordinates are normalized in WallSerializer.validate
+        serializer = self.get_serializer(data=request.data)
         if serializer.is_valid():
-            wall = serializer.save(project=project)
-            from .services import WallService
+            # The serializer's project field already verified the project
+            # exists (is_valid() resolves the pk, returning 400 for unknown
+            # ids), so no separate Project.objects.get pre-check is needed.
+            wall = serializer.save(project_id=project_id)
             if 'base_elevation_mm' in request.data:
                 wall.base_elevation_manual = True
                 wall.save(update_fields=['base_elevation_manual'])
-            else:
-                WallService.update_wall_base_elevations([wall.id])
-            wall.refresh_from_db()
-            return Response(WallSerializer(wall).data, status=status.HTTP_201_CREATED)
+            elif WallService.update_wall_base_elevations([wall.id]):
+                wall.refresh_from_db()
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     @action(detail=False, methods=['post'])
     def split_wall(self, request):
         """Split a wall at a specific intersection point"""
-        wall_id = request.data.get('wall_id')
-        intersection_x = request.data.get('intersection_x')
-        intersection_y = request.data.get('intersection_y')
-
-        if not all([wall_id, intersection_x, intersection_y]):
-            return Response(
-                {'error': 'wall_id, intersection_x, and intersection_y are required'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        payload = SplitWallInputSerializer(data=request.data)
+        if not payload.is_valid():
+            return Response(payload.errors, status=status.HTTP_400_BAD_REQUEST)
+        wall_id = payload.validated_data['wall_id']
+        intersection_x = payload.validated_data['intersection_x']
+        intersection_y = payload.validated_data['intersection_y']
 
         try:
-            split_wall_1, split_wall_2 = WallService.split_wall(wall_id, intersection_x, intersection_y)
-            
-            # After splitting a wall, recalculate room boundaries for all rooms that contained the original wall
-            from .services import RoomService
-            original_wall = Wall.objects.get(pk=wall_id)
-            rooms_with_wall = original_wall.rooms.all()
-            for room in rooms_with_wall:
-                RoomService.recalculate_room_boundary_from_walls(room.id)
-            
+            # One commit covers the split and the boundary recalculation
+            with transaction.atomic():
+                # Capture the affected rooms before the split deletes the original wall
+                room_ids = list(Room.objects.filter(walls__id=wall_id).values_list('id', flat=True))
+
+                split_wall_1, split_wall_2 = WallService.split_wall(wall_id, intersection_x, intersection_y)
+
+                # Recalculate the boundaries of every affected room in one batch
+                RoomService.recalculate_room_boundaries_bulk(room_ids)
+
+
+            # One many=True pass shares the serializer machinery over both halves
+            data_1, data_2 = WallSerializer([split_wall_1, split_wall_2], many=True).data
             return Response(
                 {
-                    'split_wall_1': WallSerializer(split_wall_1).data,
-                    'split_wall_2': WallSerializer(split_wall_2).data,
+                    'split_wall_1': data_1,
+                    'split_wall_2': data_2,
                 },
                 status=status.HTTP_201_CREATED,
             )
@@ -493,29 +526,32 @@ class WallViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['post'])
     def merge_walls(self, request):
         """Merge two walls into one"""
-        wall_ids = request.data.get('wall_ids')
-        if not wall_ids or len(wall_ids) != 2:
-            return Response(
-                {'error': 'Exactly two wall_ids are required'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        payload = MergeWallsInputSerializer(data=request.data)
+        if not payload.is_valid():
+            return Response(payload.errors, status=status.HTTP_400_BAD_REQUEST)
+        wall_ids = payload.validated_data['wall_ids']
 
         try:
-            wall_1 = Wall.objects.get(pk=wall_ids[0])
-            wall_2 = Wall.objects.get(pk=wall_ids[1])
-            
-            # Get rooms that contain these walls before merging
-            rooms_with_walls = set()
-            rooms_with_walls.update(wall_1.rooms.all())
-            rooms_with_walls.update(wall_2.rooms.all())
-            
-            merged_wall = WallService.merge_walls(wall_1, wall_2)
-            
-            # After merging walls, recalculate room boundaries for all affected rooms
-            from .services import RoomService
-            for room in rooms_with_walls:
-                RoomService.recalculate_room_boundary_from_walls(room.id)
-            
+            # One commit covers the merge and the boundary recalculation
+            with transaction.atomic():
+                # Fetch and lock both walls in a single query instead of two
+                # .get() round trips; the row locks keep a concurrent
+                # split/merge of the same walls from interleaving.
+                walls = Wall.objects.select_for_update().in_bulk(wall_ids)
+                if len(walls) != 2:
+                    raise Wall.DoesNotExist
+                wall_1, wall_2 = walls[wall_ids[0]], walls[wall_ids[1]]
+
+                # Get rooms that contain these walls before merging (one query for both)
+                room_ids = list(
+                    Room.objects.filter(walls__id__in=wall_ids).values_list('id', flat=True).distinct()
+                )
+
+                merged_wall = WallService.merge_walls(wall_1, wall_2)
+
+                # After merging walls, recalculate room boundaries for all affected rooms
+                RoomService.recalculate_room_boundaries_bulk(room_ids)
+
             return Response(WallSerializer(merged_wall).data, status=status.HTTP_201_CREATED)
         except Wall.DoesNotExist:
             return Response({'error': 'One or more walls not found'}, status=status.HTTP_404_NOT_FOUND)
@@ -525,7 +561,6 @@ class WallViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=['post'])
     def toggle_gap_fill(self, request, pk=None):
         """Toggle gap-fill mode for a wall between rooms with different heights"""
-        from .services import WallService
         
         try:
             wall = self.get_object()
@@ -569,89 +604,91 @@ class RoomViewSet(viewsets.ModelViewSet):
 
     def create(self, request, *args, **kwargs):
         """Create a new room with validation and automatic height calculation"""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         try:
-            logger.info(f"Creating room with data: {request.data}")
+            logger.info("Creating room with data: %s", request.data)
             RoomService.validate_room_points(request.data.get('room_points', []))
-            room = RoomService.create_room_with_height(request.data)
-            logger.info(f"Successfully created room {room.id} with height {room.height}")
+            # One transaction for the room, its wall memberships, and the
+            # derived wall updates: a single commit instead of one per
+            # statement, and no partial room on error.
+            with transaction.atomic():
+                room = RoomService.create_room_with_height(request.data)
+            logger.info("Successfully created room %s with height %s", room.id, room.height)
             return Response(RoomSerializer(room).data, status=status.HTTP_201_CREATED)
         except ValueError as e:
-            logger.error(f"Validation error creating room: {str(e)}")
+            logger.error("Validation error creating room: %s", e)
             return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
-        except Exception as e:
-            logger.error(f"Error creating room: {str(e)}")
-            return Response({'error': f'An error occurred: {str(e)}'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        except Exception:
+            logger.exception("Error creating room")
+            return Response(_ERROR_500, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     def update(self, request, *args, **kwargs):
         """Update a room with validation and wall height updates"""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         try:
-            logger.info(f"Updating room with data: {request.data}")
+            logger.info("Updating room with data: %s", request.data)
             if 'room_points' in request.data:
                 RoomService.validate_room_points(request.data.get('room_points', []))
             
             # Get the room instance
             room = self.get_object()
-            logger.info(f"Found room to update: {room.id}, current height: {room.height}")
+            logger.info("Found room to update: %s, current height: %s", room.id, room.height)
             
             # Update the room
             serializer = self.get_serializer(room, data=request.data, partial=kwargs.get('partial', False))
             serializer.is_valid(raise_exception=True)
-            updated_room = serializer.save()
-            logger.info(f"Updated room height to: {updated_room.height}")
-
-            if updated_room.exclude_from_ceiling and request.data.get('exclude_from_ceiling') is True:
-                from .services import CeilingService
-                CeilingService.clear_room_ceiling_data(updated_room.id)
+            # Commit the room update and the derived wall/boundary updates
+            # together so an error cannot leave them inconsistent, and the
+            # request pays for one commit instead of one per statement.
+            with transaction.atomic():
+                updated_room = serializer.save()
+                logger.info("Updated room height to: %s", updated_room.height)
+
+                if updated_room.exclude_from_ceiling and request.data.get('exclude_from_ceiling') is True:
+                    CeilingService.clear_room_ceiling_data(updated_room.id)
             
-            # If height is being updated, update wall heights (unless allow_variable_wall_heights is enabled)
-            # Pass the room's storey_id to prevent cross-level contamination
-            height_changed = any(
-                key in request.data and request.data.get(key) is not None
-                for key in ('height', 'height_min', 'height_max')
-            )
-            if height_changed and not updated_room.allow_variable_wall_heights:
-                wall_ids = list(updated_room.walls.values_list('id', flat=True))
-                room_storey_id = updated_room.storey_id if updated_room.storey_id else None
-                target_height = updated_room.height
-                logger.info(f"Updating {len(wall_ids)} walls with new height: {target_height}, room storey: {room_storey_id}")
-                updated_count = RoomService.update_wall_heights_for_room(wall_ids, target_height, room_storey_id=room_storey_id)
-                logger.info(f"Successfully updated {updated_count} walls")
-            elif updated_room.allow_variable_wall_heights and 'height' in request.data:
-                logger.info(f"Skipping wall height update for room {updated_room.id} because allow_variable_wall_heights=True (for sloped roof)")
+                # If height is being updated, update wall heights (unless allow_variable_wall_heights is enabled)
+                # Pass the room's storey_id to prevent cross-level contamination
+                height_changed = any(
+                    key in request.data and request.data.get(key) is not None
+                    for key in ('height', 'height_min', 'height_max')
+                )
+                if height_changed and not updated_room.allow_variable_wall_heights:
+                    # walls are prefetched by get_queryset; iterating the cached
+                    # relation avoids a fresh SELECT that values_list would issue
+                    wall_ids = [wall.id for wall in updated_room.walls.all()]
+                    room_storey_id = updated_room.storey_id if updated_room.storey_id else None
+                    target_height = updated_room.height
+                    logger.info("Updating %s walls with new height: %s, room storey: %s", len(wall_ids), target_height, room_storey_id)
+                    updated_count = RoomService.update_wall_heights_for_room(wall_ids, target_height, room_storey_id=room_storey_id)
+                    logger.info("Successfully updated %s walls", updated_count)
+                elif updated_room.allow_variable_wall_heights and 'height' in request.data:
+                    logger.info("Skipping wall height update for room %s because allow_variable_wall_heights=True (for sloped roof)", updated_room.id)
             
-            # Recalculate boundaries when geometry may have changed (skip metadata-only PATCHes)
-            metadata_only_fields = {
-                'exclude_from_ceiling',
-                'label_position',
-                'remarks',
-                'temperature',
-                'temperature_min',
-                'temperature_max',
-            }
-            if not set(request.data.keys()).issubset(metadata_only_fields):
-                RoomService.recalculate_room_boundary_from_walls(updated_room.id)
+                # Recalculate boundaries when geometry may have changed (skip metadata-only PATCHes)
+                metadata_only_fields = {
+                    'exclude_from_ceiling',
+                    'label_position',
+                    'remarks',
+                    'temperature',
+                    'temperature_min',
+                    'temperature_max',
+                }
+                if not set(request.data.keys()).issubset(metadata_only_fields):
+                    RoomService.recalculate_room_boundary_from_walls(updated_room.id)
             
-            # Update wall base elevations if room base elevation changed
-            if 'base_elevation_mm' in request.data:
-                from .services import WallService
-                wall_ids = list(updated_room.walls.values_list('id', flat=True))
-                if wall_ids:
-                    WallService.update_wall_base_elevations(wall_ids)
-                    logger.info(f"Updated base elevations for {len(wall_ids)} walls after room base elevation change")
+                # Update wall base elevations if room base elevation changed
+                if 'base_elevation_mm' in request.data:
+                    wall_ids = [wall.id for wall in updated_room.walls.all()]
+                    if wall_ids:
+                        WallService.update_wall_base_elevations(wall_ids)
+                        logger.info("Updated base elevations for %s walls after room base elevation change", len(wall_ids))
             
             return Response(serializer.data, status=status.HTTP_200_OK)
         except ValueError as e:
-            logger.error(f"Validation error updating room: {str(e)}")
+            logger.error("Validation error updating room: %s", e)
             return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
-        except Exception as e:
-            logger.error(f"Error updating room: {str(e)}")
-            return Response({'error': f'An error occurred: {str(e)}'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        except Exception:
+            logger.exception("Error updating room")
+            return Response(_ERROR_500, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     @action(detail=True, methods=['patch'])
     def update_height(self, request, pk=None):
@@ -661,12 +698,15 @@ class RoomViewSet(viewsets.ModelViewSet):
             if new_height is None:
                 return Response({'error': 'height is required'}, status=status.HTTP_400_BAD_REQUEST)
             
-            room = RoomService.update_room_height(pk, new_height)
+            # One commit for the room height and all derived wall heights
+            with transaction.atomic():
+                room = RoomService.update_room_height(pk, new_height)
             return Response(RoomSerializer(room).data, status=status.HTTP_200_OK)
         except ValueError as e:
             return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
-        except Exception as e:
-            return Response({'error': f'An error occurred: {str(e)}'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        except Exception:
+            logger.exception("Error updating room height")
+            return Response(_ERROR_500, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     @action(detail=False, methods=['post'])
     def calculate_min_height(self, request):
@@ -675,8 +715,9 @@ class RoomViewSet(viewsets.ModelViewSet):
             wall_ids = request.data.get('wall_ids', [])
             min_height = RoomService.calculate_minimum_wall_height(wall_ids)
             return Response({'min_height': min_height}, status=status.HTTP_200_OK)
-        except Exception as e:
-            return Response({'error': f'An error occurred: {str(e)}'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        except Exception:
+            logger.exception("Error calculating minimum wall height")
+            return Response(_ERROR_500, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     @action(detail=False, methods=['post'])
     def recalculate_boundaries(self, request):
@@ -691,24 +732,29 @@ class RoomViewSet(viewsets.ModelViewSet):
                 'message': f'Successfully recalculated boundaries for {updated_count} rooms',
                 'updated_count': updated_count
             }, status=status.HTTP_200_OK)
-        except Exception as e:
-            return Response({'error': f'An error occurred: {str(e)}'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        except Exception:
+            logger.exception("Error recalculating room boundaries")
+            return Response(_ERROR_500, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 class FloorPanelViewSet(viewsets.ModelViewSet):
     queryset = FloorPanel.objects.all()
     serializer_class = FloorPanelSerializer
+    pagination_class = OptionalCursorPagination
 
     def get_queryset(self):
         """Optionally filter floor panels by room ID or project ID"""
         room_id = self.request.query_params.get('room')
         project_id = self.request.query_params.get('project')
-        
+
         if room_id:
-            return FloorPanel.objects.filter(room_id=room_id)
+            queryset = FloorPanel.objects.filter(room_id=room_id)
         elif project_id:
-            return FloorPanel.objects.filter(room__project_id=project_id)
-
-        return super().get_queryset()
+            queryset = FloorPanel.objects.filter(room__project_id=project_id)
+        else:
+            queryset = super().get_queryset()
+        # FloorPanelSerializer reads room.id, which would otherwise fetch the
+        # room row once per panel.
+        return queryset.select_related('room')
 
 class FloorPlanViewSet(viewsets.ModelViewSet):
     queryset = FloorPlan.objects.all()
@@ -720,11 +766,13 @@ class FloorPlanViewSet(viewsets.ModelViewSet):
         project_id = self.request.query_params.get('project')
         
         if room_id:
-            return FloorPlan.objects.filter(room_id=room_id)
+            queryset = FloorPlan.objects.filter(room_id=room_id)
         elif project_id:
-            return FloorPlan.objects.filter(room__project_id=project_id)
-
-        return super().get_queryset()
+            queryset = FloorPlan.objects.filter(room__project_id=project_id)
+        else:
+            queryset = super().get_queryset()
+        # The serializer walks room.id and room.floor_panels per plan.
+        return queryset.select_related('room').prefetch_related('room__floor_panels')
 
     @action(detail=False, methods=['post'])
     def analyze_floor_orientations(self, request):
@@ -737,10 +785,19 @@ class FloorPlanViewSet(viewsets.ModelViewSet):
             return Response({'error': 'project_id is required'}, status=status.HTTP_400_BAD_REQUEST)
         
         try:
-            orientation_analysis = FloorService.analyze_floor_orientation_strategies(
-                project_id, panel_width, panel_length
+            cache_key = cache_utils.project_analysis_cache_key(
+                'floor_orientations',
+                project_id,
+                {'panel_width': panel_width, 'panel_length': panel_length},
             )
-            
+            orientation_analysis = cache_utils.get_cached_analysis(cache_key)
+            if orientation_analysis is None:
+                orientation_analysis = FloorService.analyze_floor_orientation_strategies(
+                    project_id, panel_width, panel_length
+                )
+                if 'error' not in orientation_analysis:
+                    cache_utils.set_cached_analysis(cache_key, orientation_analysis)
+
             if 'error' in orientation_analysis:
                 return Response({'error': orientation_analysis['error']}, status=status.HTTP_400_BAD_REQUEST)
             
@@ -758,31 +815,19 @@ class FloorPlanViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        project_id = request.data.get('project_id')
+        # Typed fields (project_id, custom_panel_length) are validated once by
+        # the serializer instead of per-field try/except conversions
+        payload = ProjectAnalysisInputSerializer(data=request.data)
+        if not payload.is_valid():
+            return Response(payload.errors, status=status.HTTP_400_BAD_REQUEST)
+        project_id = payload.validated_data['project_id']
+        custom_panel_length = payload.validated_data.get('custom_panel_length')
+
         orientation_strategy = request.data.get('orientation_strategy', 'auto')
         panel_width = request.data.get('panel_width', 1150)
         panel_length = request.data.get('panel_length', 'auto')
-        
-        # Extract additional generation parameters
-        custom_panel_length = request.data.get('custom_panel_length')
-        
-        if not project_id:
-            return Response({'error': 'project_id is required'}, status=status.HTTP_400_BAD_REQUEST)
-        
+
         try:
-            # Convert project_id to int if it's a string
-            try:
-                project_id = int(project_id)
-            except (ValueError, TypeError):
-                return Response({'error': 'project_id must be a valid integer'}, status=status.HTTP_400_BAD_REQUEST)
-            
-            # Convert custom_panel_length to float if provided
-            if custom_panel_length is not None:
-                try:
-                    custom_panel_length = float(custom_panel_length)
-                except (ValueError, TypeError):
-                    return Response({'error': 'custom_panel_length must be a valid number'}, status=status.HTTP_400_BAD_REQUEST)
-            
             floor_plan = FloorService.generate_floor_plan(
                 project_id, 
                 orientation_strategy,
@@ -802,6 +847,7 @@ class FloorPlanViewSet(viewsets.ModelViewSet):
 class CeilingPanelViewSet(viewsets.ModelViewSet):
     queryset = CeilingPanel.objects.all()
     serializer_class = CeilingPanelSerializer
+    pagination_class = OptionalCursorPagination
 
     def get_queryset(self):
         """Optionally filter ceiling panels by room ID or project ID"""
@@ -810,17 +856,21 @@ class CeilingPanelViewSet(viewsets.ModelViewSet):
         zone_id = self.request.query_params.get('zone')
         
         if room_id:
-            return CeilingPanel.objects.filter(room_id=room_id)
+            queryset = CeilingPanel.objects.filter(room_id=room_id)
         elif zone_id:
-            return CeilingPanel.objects.filter(zone_id=zone_id)
+            queryset = CeilingPanel.objects.filter(zone_id=zone_id)
         elif project_id:
             # Filter by project by getting rooms that belong to the project
-            from django.db.models import Q
-            return CeilingPanel.objects.filter(
+            queryset = CeilingPanel.objects.filter(
                 Q(room__project_id=project_id) | Q(zone__project_id=project_id)
             )
-        
-        return super().get_queryset()
+        else:
+            queryset = super().get_queryset()
+        if self.action == 'list':
+            # CeilingPanelSerializer never exposes the timestamps
+            queryset = queryset.defer('created_at', 'updated_at')
+        # The serializer reads room.id and zone.id per panel.
+        return queryset.select_related('room', 'zone')
 
 class CeilingPlanViewSet(viewsets.ModelViewSet):
     queryset = CeilingPlan.objects.all()
@@ -833,16 +883,20 @@ class CeilingPlanViewSet(viewsets.ModelViewSet):
         zone_id = self.request.query_params.get('zone')
         
         if room_id:
-            return CeilingPlan.objects.filter(room_id=room_id)
+            queryset = CeilingPlan.objects.filter(room_id=room_id)
         elif zone_id:
-            return CeilingPlan.objects.filter(zone_id=zone_id)
+            queryset = CeilingPlan.objects.filter(zone_id=zone_id)
         elif project_id:
-            from django.db.models import Q
-            return CeilingPlan.objects.filter(
+            queryset = CeilingPlan.objects.filter(
                 Q(room__project_id=project_id) | Q(zone__project_id=project_id)
             )
-        
-        return super().get_queryset()
+        else:
+            queryset = super().get_queryset()
+        # The serializer walks room.ceiling_panels (or zone.ceiling_panels for
+        # zone-backed plans) per plan.
+        return queryset.select_related('room', 'zone').prefetch_related(
+            'room__ceiling_panels', 'zone__ceiling_panels'
+        )
 
     @action(detail=False, methods=['post'])
     def generate_ceiling_plan(self, request):
@@ -854,7 +908,7 @@ class CeilingPlanViewSet(viewsets.ModelViewSet):
             return Response({'error': 'room_id is required'}, status=status.HTTP_400_BAD_REQUEST)
         
         # Validate panel length option
-        if panel_length_option not in [1, 2, 3, 4, 5]:
+        if panel_length_option not in VALID_PANEL_LENGTH_OPTIONS:
             return Response({'error': 'panel_length_option must be 1, 2, 3, 4, or 5'}, status=status.HTTP_400_BAD_REQUEST)
         
         try:
@@ -864,6 +918,7 @@ class CeilingPlanViewSet(viewsets.ModelViewSet):
             return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
     @action(detail=False, methods=['get'])
+    @method_decorator(etag(_project_etag))
     def analyze_project_heights(self, request):
         """Analyze project room heights and provide grouping recommendations"""
         project_id = request.query_params.get('project_id')
@@ -871,7 +926,12 @@ class CeilingPlanViewSet(viewsets.ModelViewSet):
             return Response({'error': 'project_id is required'}, status=status.HTTP_400_BAD_REQUEST)
         
         try:
-            height_analysis = CeilingService.analyze_project_heights(project_id)
+            cache_key = cache_utils.project_analysis_cache_key('heights', project_id)
+            height_analysis = cache_utils.get_cached_analysis(cache_key)
+            if height_analysis is None:
+                height_analysis = CeilingService.analyze_project_heights(project_id)
+                if 'error' not in height_analysis:
+                    cache_utils.set_cached_analysis(cache_key, height_analysis)
             return Response(height_analysis, status=status.HTTP_200_OK)
         except Exception as e:
             return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
@@ -879,28 +939,36 @@ class CeilingPlanViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['post'])
     def analyze_orientations(self, request):
         """Stage 2: Analyze different panel orientation strategies"""
-        project_id = request.data.get('project_id')
+        payload = ProjectAnalysisInputSerializer(data=request.data)
+        if not payload.is_valid():
+            return Response(payload.errors, status=status.HTTP_400_BAD_REQUEST)
+        project_id = payload.validated_data['project_id']
+
         panel_width = request.data.get('panel_width', 1150)
         panel_length = request.data.get('panel_length', 'auto')
         ceiling_thickness = request.data.get('ceiling_thickness', 150)
-        
-        if not project_id:
-            return Response({'error': 'project_id is required'}, status=status.HTTP_400_BAD_REQUEST)
-        
+
         try:
-            # Convert project_id to int if it's a string
-            try:
-                project_id = int(project_id)
-            except (ValueError, TypeError):
-                return Response({'error': 'project_id must be a valid integer'}, status=status.HTTP_400_BAD_REQUEST)
-            
-            orientation_analysis = CeilingService.analyze_orientation_strategies(
-                project_id, 
-                panel_width, 
-                panel_length, 
-                ceiling_thickness
+            cache_key = cache_utils.project_analysis_cache_key(
+                'ceiling_orientations',
+                project_id,
+                {
+                    'panel_width': panel_width,
+                    'panel_length': panel_length,
+                    'ceiling_thickness': ceiling_thickness,
+                },
             )
-            
+            orientation_analysis = cache_utils.get_cached_analysis(cache_key)
+            if orientation_analysis is None:
+                orientation_analysis = CeilingService.analyze_orientation_strategies(
+                    project_id,
+                    panel_width,
+                    panel_length,
+                    ceiling_thickness
+                )
+                if 'error' not in orientation_analysis:
+                    cache_utils.set_cached_analysis(cache_key, orientation_analysis)
+
             if 'error' in orientation_analysis:
                 return Response({'error': orientation_analysis['error']}, status=status.HTTP_400_BAD_REQUEST)
             
@@ -912,37 +980,25 @@ class CeilingPlanViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['post'])
     def generate_enhanced_ceiling_plan(self, request):
         """Stage 3: Generate enhanced ceiling plan with intelligent panel placement"""
-        project_id = request.data.get('project_id')
+        payload = ProjectAnalysisInputSerializer(data=request.data)
+        if not payload.is_valid():
+            return Response(payload.errors, status=status.HTTP_400_BAD_REQUEST)
+        project_id = payload.validated_data['project_id']
+        custom_panel_length = payload.validated_data.get('custom_panel_length')
+
         orientation_strategy = request.data.get('orientation_strategy', 'auto')
         panel_width = request.data.get('panel_width', 1150)
         panel_length = request.data.get('panel_length', 'auto')
         ceiling_thickness = request.data.get('ceiling_thickness', 150)
-        
+
         # Extract additional generation parameters
-        custom_panel_length = request.data.get('custom_panel_length')
         support_type = request.data.get('support_type', 'nylon')
         support_config = request.data.get('support_config', {})
-        
+
         # Extract room-specific configuration (if provided)
         room_specific_config = request.data.get('room_specific_config')
-        
-        if not project_id:
-            return Response({'error': 'project_id is required'}, status=status.HTTP_400_BAD_REQUEST)
-        
+
         try:
-            # Convert project_id to int if it's a string
-            try:
-                project_id = int(project_id)
-            except (ValueError, TypeError):
-                return Response({'error': 'project_id must be a valid integer'}, status=status.HTTP_400_BAD_REQUEST)
-            
-            # Convert custom_panel_length to float if provided
-            if custom_panel_length is not None:
-                try:
-                    custom_panel_length = float(custom_panel_length)
-                except (ValueError, TypeError):
-                    return Response({'error': 'custom_panel_length must be a valid number'}, status=status.HTTP_400_BAD_REQUEST)
-            
             enhanced_plan = CeilingService.generate_enhanced_ceiling_plan(
                 project_id, 
                 orientation_strategy,
@@ -973,7 +1029,7 @@ class CeilingPlanViewSet(viewsets.ModelViewSet):
             return Response({'error': 'project_id is required'}, status=status.HTTP_400_BAD_REQUEST)
         
         # Validate panel length option
-        if panel_length_option not in [1, 2, 3, 4, 5]:
+        if panel_length_option not in VALID_PANEL_LENGTH_OPTIONS:
             return Response({'error': 'panel_length_option must be 1, 2, 3, 4, or 5'}, status=status.HTTP_400_BAD_REQUEST)
         
         try:
@@ -983,6 +1039,7 @@ class CeilingPlanViewSet(viewsets.ModelViewSet):
             return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
     @action(detail=False, methods=['get'])
+    @method_decorator(etag(_project_etag))
     def generate_project_report(self, request):
         """Stage 5: Generate comprehensive project ceiling report"""
         project_id = request.query_params.get('project_id')
@@ -1006,20 +1063,25 @@ class CeilingPlanViewSet(viewsets.ModelViewSet):
             return Response({'error': 'project_id is required'}, status=status.HTTP_400_BAD_REQUEST)
         
         try:
-            csv_data = CeilingService.export_ceiling_report_to_csv(project_id)
-            if 'error' in csv_data:
-                return Response({'error': csv_data['error']}, status=status.HTTP_400_BAD_REQUEST)
-            
-            # Return CSV as downloadable file
-            from django.http import HttpResponse
-            response = HttpResponse(csv_data['csv_content'], content_type='text/csv')
-            response['Content-Disposition'] = f'attachment; filename="{csv_data["filename"]}"'
+            report_data = CeilingService.generate_project_ceiling_report(project_id)
+            if 'error' in report_data:
+                return Response({'error': report_data['error']}, status=status.HTTP_400_BAD_REQUEST)
+
+            # Stream the CSV row by row instead of buffering the whole file
+            from django.http import StreamingHttpResponse
+            response = StreamingHttpResponse(
+                CeilingService.iter_ceiling_report_csv(report_data),
+                content_type='text/csv',
+            )
+            filename = CeilingService.ceiling_report_csv_filename(report_data)
+            response['Content-Disposition'] = f'attachment; filename="{filename}"'
             return response
-            
+
         except Exception as e:
             return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
     @action(detail=False, methods=['get'])
+    @method_decorator(etag(_project_etag))
     def visualization_data(self, request):
         """Stage 5: Get ceiling plan visualization data"""
         project_id = request.query_params.get('project_id')
@@ -1107,13 +1169,20 @@ class DoorViewSet(viewsets.ModelViewSet):
         return super().get_queryset()
 
     @action(detail=True, methods=['get'])
+    @method_decorator(etag(_project_etag))
     def doors(self, request, pk=None):
         """Retrieve doors associated with a specific project"""
         try:
-            project = Project.objects.get(pk=pk)
-            doors = Door.objects.filter(project=project)
-            serializer = DoorSerializer(doors, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            cache_key = cache_utils.project_doors_cache_key(pk)
+            data = cache_utils.get_cached_project_response(cache_key)
+            if data is None:
+                if not Project.objects.filter(pk=pk).exists():
+                    return Response({'error': 'Project not found'}, status=status.HTTP_404_NOT_FOUND)
+                doors = Door.objects.prefetch_related('windows').filter(project_id=pk)
+                # Plain list pickles faster than DRF's ReturnList wrapper
+                data = list(DoorSerializer(doors, many=True).data)
+                cache_utils.set_cached_project_response(cache_key, data)
+            return Response(data, status=status.HTTP_200_OK)
         except Project.DoesNotExist:
             return Response({'error': 'Project not found'}, status=status.HTTP_404_NOT_FOUND)
 
@@ -1125,8 +1194,9 @@ class DoorViewSet(viewsets.ModelViewSet):
             return Response(DoorSerializer(door).data, status=status.HTTP_201_CREATED)
         except ValueError as e:
             return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
-        except Exception as e:
-            return Response({'error': f'An error occurred: {str(e)}'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        except Exception:
+            logger.exception("Error creating door")
+            return Response(_ERROR_500, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 class WindowViewSet(viewsets.ModelViewSet):
     queryset = Window.objects.all()
@@ -1214,24 +1284,24 @@ class IntersectionViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['post'], url_path='set_joint')
     def set_joint(self, request):
         """Set the joining method for an intersection"""
-        wall_1_id = request.data.get('wall_1')
-        wall_2_id = request.data.get('wall_2')
-        joining_method = request.data.get('joining_method')
-
-        if not all([wall_1_id, wall_2_id, joining_method]):
-            return Response(
-                {'error': 'wall_1, wall_2, and joining_method are required'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        payload = SetJointInputSerializer(data=request.data)
+        if not payload.is_valid():
+            return Response(payload.errors, status=status.HTTP_400_BAD_REQUEST)
+        wall_1_id = payload.validated_data['wall_1']
+        wall_2_id = payload.validated_data['wall_2']
+        joining_method = payload.validated_data['joining_method']
 
         try:
-            wall_1 = Wall.objects.get(pk=wall_1_id)
-            wall_2 = Wall.objects.get(pk=wall_2_id)
-            
+            # Fetch both walls in a single query instead of two .get() round trips
+            walls = Wall.objects.in_bulk([wall_1_id, wall_2_id])
+            if len(walls) != 2:
+                raise Wall.DoesNotExist
+            wall_1, wall_2 = walls[wall_1_id], walls[wall_2_id]
+
             # Check for existing intersection with either wall order (wall_1/wall_2 or wall_2/wall_1)
             # This prevents duplicate intersections for the same wall pair
             intersection = Intersection.objects.filter(
-                project=wall_1.project
+                project_id=wall_1.project_id
             ).filter(
                 (Q(wall_1=wall_1) & Q(wall_2=wall_2)) | 
                 (Q(wall_1=wall_2) & Q(wall_2=wall_1))
@@ -1247,16 +1317,103 @@ class IntersectionViewSet(viewsets.ModelViewSet):
             else:
                 # Create new intersection with the provided wall order
                 intersection = Intersection.objects.create(
-                project=wall_1.project,
-                wall_1=wall_1,
-                wall_2=wall_2,
-                    joining_method=joining_method
-            )
+                    project_id=wall_1.project_id,
+                    wall_1=wall_1,
+                    wall_2=wall_2,
+                    joining_method=joining_method,
+                )
 
             return Response(IntersectionSerializer(intersection).data, status=status.HTTP_200_OK)
         except Wall.DoesNotExist:
             return Response({'error': 'One or more walls not found'}, status=status.HTTP_404_NOT_FOUND)
 
+    @action(detail=False, methods=['post'], url_path='set_joints_bulk')
+    def set_joints_bulk(self, request):
+        """Set joining methods for many wall pairs in one request.
+
+        Accepts {'project': id, 'joints': [{'wall_1':..,'wall_2':..,'joining_method':..}, ...]}
+        and amortizes the per-request and per-query overhead of calling set_joint
+        once per intersection point.
+        """
+        project_id = request.data.get('project')
+        joints = request.data.get('joints')
+
+        if not project_id or not isinstance(joints, list) or not joints:
+            return Response(
+                {'error': 'project and a non-empty joints list are required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            project_id = int(project_id)
+        except (TypeError, ValueError):
+            return Response(
+                {'error': 'project must be an integer'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # Same per-joint validation as the single set_joint endpoint: integer
+        # wall ids, a known joining method, and two different walls.
+        payload = SetJointInputSerializer(data=joints, many=True)
+        if not payload.is_valid():
+            return Response(payload.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        # Deduplicate by wall pair (last entry wins) while preserving the
+        # user-specified wall order, which matters for butt-in joints.
+        joints_by_pair = {}
+        for joint in payload.validated_data:
+            joints_by_pair[frozenset((joint['wall_1'], joint['wall_2']))] = (
+                joint['wall_1'], joint['wall_2'], joint['joining_method']
+            )
+
+        wall_ids = {wall_id for pair in joints_by_pair.values() for wall_id in pair[:2]}
+        walls = Wall.objects.filter(project_id=project_id).in_bulk(wall_ids)
+        missing = wall_ids - set(walls)
+        if missing:
+            return Response(
+                {'error': f'Walls not found in this project: {sorted(missing)}'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        # Fetch existing intersections for all pairs (either wall order) in one query.
+        pair_filter = Q()
+        for wall_1_id, wall_2_id, _ in joints_by_pair.values():
+            pair_filter |= (Q(wall_1_id=wall_1_id) & Q(wall_2_id=wall_2_id)) | \
+                           (Q(wall_1_id=wall_2_id) & Q(wall_2_id=wall_1_id))
+        existing = {
+            frozenset((intersection.wall_1_id, intersection.wall_2_id)): intersection
+            for intersection in Intersection.objects.filter(project_id=project_id).filter(pair_filter)
+        }
+
+        to_update = []
+        to_create = []
+        for pair, (wall_1_id, wall_2_id, joining_method) in joints_by_pair.items():
+            intersection = existing.get(pair)
+            if intersection:
+                intersection.wall_1_id = wall_1_id
+                intersection.wall_2_id = wall_2_id
+                intersection.joining_method = joining_method
+                to_update.append(intersection)
+            else:
+                to_create.append(Intersection(
+                    project_id=project_id,
+                    wall_1_id=wall_1_id,
+                    wall_2_id=wall_2_id,
+                    joining_method=joining_method,
+                ))
+
+        with transaction.atomic():
+            if to_update:
+                Intersection.objects.bulk_update(to_update, ['wall_1', 'wall_2', 'joining_method'])
+            if to_create:
+                to_create = Intersection.objects.bulk_create(to_create)
+
+        # bulk_update/bulk_create skip the Intersection post_save activity
+        # signal; bump the project like the single set_joint endpoint does.
+        mark_project_edited(project_id)
+
+        serializer = IntersectionSerializer(to_update + list(to_create), many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
 
 class PlanAnnotationViewSet(viewsets.ModelViewSet):
     queryset = PlanAnnotation.objects.select_related('project', 'storey', 'created_by').all()
@@ -142,6 +142,17 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': (
         'core.permissions.IsEditorOrReadOnly',
     ),
+    # orjson renders the float-heavy wall/panel payloads several times faster
+    # than the stdlib json encoder used by DRF's default renderer.
+    'DEFAULT_RENDERER_CLASSES': (
+        'drf_orjson_renderer.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'drf_orjson_renderer.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
 }
 CSRF_TRUSTED_ORIGINS = [
     "http://localhost:3000",
@@ -150,6 +161,15 @@ CSRF_TRUSTED_ORIGINS = [
     "http://127.0.0.1:3001",
 ]
 
+# Response cache for project walls/doors endpoints. Local memory is fine for
+# the single-process dev server; production swaps in Redis (see
+# settings_production.py) so invalidation reaches every worker.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
 # Logging configuration
 LOGGING = {
     'version': 1,
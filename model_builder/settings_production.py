@@ -27,6 +27,16 @@ DATABASES = {
         'PASSWORD': os.environ.get('DB_PASSWORD', '5702Tci123'),
         'HOST': os.environ.get('DB_HOST', '127.0.0.1'),
         'PORT': os.environ.get('DB_PORT', '5432'),
+        # psycopg3 connection pool: reuses server connections across requests
+        # instead of paying a TCP + auth handshake per request. Incompatible
+        # with CONN_MAX_AGE, which must stay at its default of 0.
+        'OPTIONS': {
+            'pool': {
+                'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', 2)),
+                'max_size': int(os.environ.get('DB_POOL_MAX_SIZE', 4)),
+                'timeout': 10,
+            },
+        },
     }
 }
 
@@ -54,6 +64,24 @@ CORS_ALLOW_CREDENTIALS = True
 _csrf = os.environ.get('CSRF_TRUSTED_ORIGINS', '').strip()
 CSRF_TRUSTED_ORIGINS = [o.strip() for o in _csrf.split(',') if o.strip()] if _csrf else CORS_ALLOWED_ORIGINS
 
+# Response cache. Redis is shared across gunicorn workers so write
+# invalidation is visible everywhere; without REDIS_URL caching is disabled
+# (a per-process LocMem cache would serve stale data across workers).
+_redis_url = os.environ.get('REDIS_URL', '').strip()
+if _redis_url:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': _redis_url,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+        }
+    }
+
 # Logging configuration for production
 LOGGING = {
     'version': 1,
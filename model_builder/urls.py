@@ -3,41 +3,25 @@ from django.urls import path, include, re_path
 from django.views.generic import TemplateView
 from django.conf import settings
 from django.conf.urls.static import static
-from rest_framework.routers import DefaultRouter
-from core.views import ProjectViewSet, WallViewSet
 from model_builder.views import serve_react_app
 
-# Create a router for the API endpoints
-router = DefaultRouter()
-router.register(r'projects', ProjectViewSet, basename='project')
-router.register(r'walls', WallViewSet, basename='wall')
-
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/', include('core.urls')),  # Include URLs from the core app
 ]
 
-# Serve static files in development
-if settings.DEBUG:
-    urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+# Serve static/media files (no-op when DEBUG is False; WhiteNoise handles
+# static assets in production)
+urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
+urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
 
-# Serve React frontend for all other routes (production)
+# Serve React frontend for all other routes (production). The negative
+# lookahead keeps api/static/media and well-known root files out of the
+# catch-all so they 404 fast instead of rendering the SPA shell.
 if not settings.DEBUG:
-    # Serve static files first in production
-    urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
-    
-    # Then serve React app for all other routes (excluding api, static, and media)
-    # WhiteNoise middleware will handle static files, so we exclude them from the catch-all
-    # Use custom view to properly exclude static/media paths
     urlpatterns += [
         re_path(
             r'^(?!api/|static/|media/|manifest\.json|favicon\.ico|robots\.txt|logo[0-9]+\.png).*$',
             serve_react_app,
         ),
-    ]
-else:
-    # In development, serve static files
-    urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
\ No newline at end of file
+    ]
\ No newline at end of file
@@ -2,9 +2,10 @@
 Custom views for serving React app in production
 """
 import os
+from functools import lru_cache
 
 from django.conf import settings
-from django.http import FileResponse, Http404
+from django.http import Http404, HttpResponse
 from django.shortcuts import render
 
 
@@ -17,6 +18,24 @@ def _frontend_dist_index_path():
     return os.path.join(frontend_build, 'index.html')
 
 
+@lru_cache(maxsize=1)
+def _dist_index_if_present():
+    """Resolve the built frontend index once per process.
+
+    The dist bundle only changes on deploy (which restarts the process),
+    so re-statting it on every SPA route hit is wasted syscall work.
+    """
+    path = _frontend_dist_index_path()
+    return path if os.path.isfile(path) else None
+
+
+@lru_cache(maxsize=1)
+def _dist_index_bytes():
+    """Read the SPA shell into memory once; every deep link serves these bytes."""
+    with open(_dist_index_if_present(), 'rb') as f:
+        return f.read()
+
+
 def serve_react_app(request):
     """
     Serve the React app for all non-API routes.
@@ -34,10 +53,9 @@ def serve_react_app(request):
     ):
         raise Http404("Not found")
 
-    dist_index = _frontend_dist_index_path()
-    if os.path.isfile(dist_index):
-        return FileResponse(
-            open(dist_index, 'rb'),
+    if _dist_index_if_present():
+        return HttpResponse(
+            _dist_index_bytes(),
             content_type='text/html; charset=utf-8',
         )
 